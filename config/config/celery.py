@@ -2,7 +2,8 @@
 Celery configuration for the MEDIATRENDS project.
 
 Beat schedule:
-- AI-powered autonomous scraping (hourly via Jina AI)
+- AI-powered autonomous scraping via Jina AI (one batched task every 5 min,
+  each source re-scraped after its own ``scrape_interval_hours``)
 - Daily cleanup of old data
 """
 
@@ -17,6 +18,16 @@ app = Celery('config')
 app.config_from_object('django.conf:settings', namespace='CELERY')
 app.autodiscover_tasks()
 
+# Fetch one task at a time and acknowledge it only after it finishes, so a
+# long scrape cannot hold queued embedding/matching tasks hostage on the same
+# worker.  Recycle worker processes periodically to release memory held by
+# the scraper and the embedding model.
+app.conf.update(
+    worker_prefetch_multiplier=1,
+    task_acks_late=True,
+    worker_max_tasks_per_child=50,
+)
+
 # Use 'solo' pool on Windows (prefork/billiard doesn't work on Windows)
 if platform.system() == 'Windows':
     app.conf.worker_pool = 'solo'
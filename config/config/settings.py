@@ -155,6 +155,8 @@ TG_BOT_TOKEN = os.getenv('TELEGRAM_BOT_TOKEN', 'your bot token')
 
 JINA_API_KEY = os.getenv('JINA_API_KEY', '')  # Optional, for higher rate limits
 JINA_READER_URL = 'https://r.jina.ai/'
+JINA_REQUESTS_PER_SECOND = 5  # Shared Reader request budget per worker process
+JINA_ARTICLE_CACHE_TTL = 60 * 60  # Seconds a scraped article is reused (0 = off)
 
 
 # =============================================================================
@@ -164,6 +166,8 @@ JINA_READER_URL = 'https://r.jina.ai/'
 ELASTICSEARCH_HOST = os.getenv('ELASTICSEARCH_HOST', 'http://localhost:9200')
 ELASTICSEARCH_USER = os.getenv('ELASTICSEARCH_USER', '')
 ELASTICSEARCH_PASSWORD = os.getenv('ELASTICSEARCH_PASSWORD', '')
+ELASTICSEARCH_MAXSIZE = 32  # HTTP connections kept per ES node
+ELASTICSEARCH_BULK_THREADS = int(os.getenv('ELASTICSEARCH_BULK_THREADS', '1'))  # >1 = parallel_bulk
 
 
 # =============================================================================
@@ -172,6 +176,9 @@ ELASTICSEARCH_PASSWORD = os.getenv('ELASTICSEARCH_PASSWORD', '')
 
 EMBEDDING_MODEL = 'paraphrase-multilingual-mpnet-base-v2'
 EMBEDDING_DIMENSION = 768  # Model output dimensionality
+EMBEDDING_CACHE_SIZE = 4096  # Recently encoded texts kept per process (0 = off)
+EMBEDDING_PRECISION = os.getenv('EMBEDDING_PRECISION', 'auto')  # auto | bf16 | fp32
+EMBEDDING_BATCH_SIZE = None  # Texts per forward pass; None = 128 on GPU, 16 on CPU
 
 
 # =============================================================================
@@ -189,6 +196,8 @@ SEMANTIC_TITLE_THRESHOLD = 0.45  # Keyword embedding vs title embedding threshol
 
 SCRAPE_TIMEOUT = 30         # HTTP request timeout in seconds
 MAX_ARTICLES_PER_SCRAPE = 20  # Max articles to scrape per source per run
+SCRAPE_MAX_WORKERS = 4      # Article pages fetched concurrently per source
+FAST_SCRAPE_DOMAINS = []    # Sites scraped from raw HTML (needs selectolax + trafilatura)
 
 
 # =============================================================================
@@ -5,7 +5,10 @@ All scraping is powered by Jina AI. Just add a NewsSource URL in the admin
 panel and the system scrapes it automatically — no code needed.
 """
 
+from django.conf import settings
 from django.contrib import admin
+from django.db.models import BooleanField, ExpressionWrapper, Q
+from django.db.models.functions import Length
 
 from .models import (
     NewsArticle,
@@ -78,6 +81,8 @@ class NewsArticleAdmin(admin.ModelAdmin):
     search_fields = ['title', 'content', 'url', 'category']
     readonly_fields = ['scraped_at', 'updated_at', 'es_index_date']
     date_hierarchy = 'scraped_at'
+    list_select_related = ('source',)
+    list_per_page = 50
     actions = ['reindex_elasticsearch', 'regenerate_embeddings']
 
     fieldsets = (
@@ -97,7 +102,7 @@ class NewsArticleAdmin(admin.ModelAdmin):
         }),
     )
 
-    @admin.display(description='Title')
+    @admin.display(description='Title', ordering='title')
     def title_short(self, obj):
         return obj.title[:80] + '…' if len(obj.title) > 80 else obj.title
 
@@ -107,11 +112,25 @@ class NewsArticleAdmin(admin.ModelAdmin):
         link = obj.article_link or obj.url
         return format_html('<a href="{}" target="_blank">Open</a>', link)
 
-    @admin.display(description='Embedding', boolean=True)
+    def get_queryset(self, request):
+        # The change list only needs to know *whether* a full-size vector
+        # exists, so compare the packed float32 length in SQL and never
+        # load either embedding copy per row.  The article body is not
+        # listed either; it is fetched on demand when the change form is
+        # opened.
+        qs = super().get_queryset(request).defer(
+            'content', 'content_embedding', 'content_embedding_bin',
+        )
+        dim = getattr(settings, 'EMBEDDING_DIMENSION', 768)
+        return qs.alias(_embedding_bytes=Length('content_embedding_bin')).annotate(
+            _has_embedding=ExpressionWrapper(
+                Q(_embedding_bytes=dim * 4), output_field=BooleanField(),
+            ),
+        )
+
+    @admin.display(description='Embedding', boolean=True, ordering='_has_embedding')
     def has_embedding(self, obj):
-        from django.conf import settings as django_settings
-        dim = getattr(django_settings, 'EMBEDDING_DIMENSION', 768)
-        return obj.content_embedding is not None and len(obj.content_embedding or []) == dim
+        return obj._has_embedding
 
     @admin.action(description='🔄 Re-index selected in ElasticSearch')
     def reindex_elasticsearch(self, request, queryset):
@@ -122,12 +141,9 @@ class NewsArticleAdmin(admin.ModelAdmin):
     @admin.action(description='🧠 Regenerate embeddings')
     def regenerate_embeddings(self, request, queryset):
         """Clear embeddings so the periodic task regenerates them."""
-        count = 0
-        for article in queryset:
-            article.content_embedding = None
-            article.es_indexed = False
-            article.save(update_fields=['content_embedding', 'es_indexed'])
-            count += 1
+        count = queryset.update(
+            content_embedding=None, content_embedding_bin=None, es_indexed=False,
+        )
         self.message_user(request, f"Cleared embeddings for {count} article(s) — will regenerate on next cycle.")
 
 
@@ -142,21 +158,18 @@ class UserKeywordAdmin(admin.ModelAdmin):
 
     @admin.display(description='Embedding', boolean=True)
     def has_embedding_display(self, obj):
-        from django.conf import settings as django_settings
-        dim = getattr(django_settings, 'EMBEDDING_DIMENSION', 768)
-        return obj.keyword_embedding is not None and len(obj.keyword_embedding or []) == dim
+        return obj.has_embedding
 
     @admin.action(description='🧠 Regenerate keyword embeddings')
     def regenerate_embeddings(self, request, queryset):
         """Regenerate embeddings for selected keywords."""
         from .tasks import generate_keyword_embedding
 
-        count = 0
-        for kw in queryset:
-            kw.keyword_embedding = None
-            kw.save(update_fields=['keyword_embedding'])
-            generate_keyword_embedding.delay(kw.id)
-            count += 1
+        keyword_ids = list(queryset.values_list('id', flat=True))
+        queryset.update(keyword_embedding=None)
+        for kw_id in keyword_ids:
+            generate_keyword_embedding.delay(kw_id)
+        count = len(keyword_ids)
         self.message_user(request, f"Dispatched embedding regeneration for {count} keyword(s).")
 
 
@@ -169,8 +182,12 @@ class SentArticleAdmin(admin.ModelAdmin):
     search_fields = ['user_id', 'article__title']
     readonly_fields = ['sent_at']
     date_hierarchy = 'sent_at'
+    list_per_page = 50
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).with_article()
 
-    @admin.display(description='Article')
+    @admin.display(description='Article', ordering='article__title')
     def article_title(self, obj):
         if obj.article:
             return obj.article.title[:60] + '…' if len(obj.article.title) > 60 else obj.article.title
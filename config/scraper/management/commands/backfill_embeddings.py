@@ -70,8 +70,13 @@ class Command(BaseCommand):
         """Backfill embeddings for articles without them."""
         from scraper.models import NewsArticle
 
-        articles = NewsArticle.objects.filter(content_embedding__isnull=True)
-        total = articles.count()
+        # Snapshot the PKs up front: rows drop out of the ``isnull`` filter as
+        # they are filled in, so offset slicing would skip every other batch.
+        article_ids = list(
+            NewsArticle.objects.filter(content_embedding__isnull=True)
+            .order_by('pk').values_list('pk', flat=True)
+        )
+        total = len(article_ids)
 
         if total == 0:
             self.stdout.write('  No articles need embeddings.')
@@ -82,17 +87,24 @@ class Command(BaseCommand):
 
         # Process in batches
         for start in range(0, total, batch_size):
-            batch = list(articles[start:start + batch_size])
+            batch = list(
+                NewsArticle.objects.filter(pk__in=article_ids[start:start + batch_size])
+                .only('pk', 'title', 'content')
+            )
             texts = [f"{a.title}\n\n{a.content}" for a in batch]
 
             try:
                 embeddings = svc.get_embeddings_batch(texts)
 
+                updated = []
                 for article, embedding in zip(batch, embeddings):
                     if embedding and not all(v == 0.0 for v in embedding):
-                        article.content_embedding = embedding
-                        article.save(update_fields=['content_embedding'])
-                        processed += 1
+                        article.set_content_embedding(embedding)
+                        updated.append(article)
+                NewsArticle.objects.bulk_update(
+                    updated, ['content_embedding', 'content_embedding_bin'],
+                )
+                processed += len(updated)
             except Exception as exc:
                 self.stderr.write(f'  ✗ Batch error at offset {start}: {exc}')
 
@@ -105,8 +117,11 @@ class Command(BaseCommand):
         """Backfill embeddings for keywords without them."""
         from scraper.models import UserKeyword
 
-        keywords = UserKeyword.objects.filter(keyword_embedding__isnull=True)
-        total = keywords.count()
+        keyword_ids = list(
+            UserKeyword.objects.filter(keyword_embedding__isnull=True)
+            .order_by('pk').values_list('pk', flat=True)
+        )
+        total = len(keyword_ids)
 
         if total == 0:
             self.stdout.write('  No keywords need embeddings.')
@@ -116,17 +131,22 @@ class Command(BaseCommand):
         processed = 0
 
         for start in range(0, total, batch_size):
-            batch = list(keywords[start:start + batch_size])
+            batch = list(
+                UserKeyword.objects.filter(pk__in=keyword_ids[start:start + batch_size])
+                .only('pk', 'keyword')
+            )
             texts = [f"News article about {kw.keyword}" for kw in batch]
 
             try:
                 embeddings = svc.get_embeddings_batch(texts)
 
+                updated = []
                 for kw, embedding in zip(batch, embeddings):
                     if embedding and not all(v == 0.0 for v in embedding):
                         kw.keyword_embedding = embedding
-                        kw.save(update_fields=['keyword_embedding'])
-                        processed += 1
+                        updated.append(kw)
+                UserKeyword.objects.bulk_update(updated, ['keyword_embedding'])
+                processed += len(updated)
             except Exception as exc:
                 self.stderr.write(f'  ✗ Batch error at offset {start}: {exc}')
 
@@ -1,15 +1,17 @@
 """
 Management command: Reindex all articles in ElasticSearch.
 
-Reads every ``NewsArticle`` with an embedding and bulk-indexes them
+Streams every ``NewsArticle`` with an embedding and bulk-indexes them
 into the ``news_articles`` ES index.
 
 Usage:
     python manage.py reindex_elasticsearch
     python manage.py reindex_elasticsearch --batch-size 200
     python manage.py reindex_elasticsearch --recreate-index
+    python manage.py reindex_elasticsearch --threads 8
 """
 
+import numpy as np
 from django.core.management.base import BaseCommand, CommandError
 from django.utils import timezone
 
@@ -30,10 +32,18 @@ class Command(BaseCommand):
             default=False,
             help='Delete and recreate the ES index before reindexing.',
         )
+        parser.add_argument(
+            '--threads',
+            type=int,
+            default=None,
+            help='Send bulk requests from this many threads '
+                 '(default: settings.ELASTICSEARCH_BULK_THREADS).',
+        )
 
     def handle(self, *args, **options):
         batch_size = options['batch_size']
         recreate = options['recreate_index']
+        threads = options['threads']
 
         try:
             from scraper.services.elasticsearch_service import ElasticSearchService
@@ -59,9 +69,11 @@ class Command(BaseCommand):
 
         from scraper.models import NewsArticle
 
+        # Vectors come from the packed float32 column (a frombuffer per row);
+        # the JSON copy is never loaded.
         articles_qs = NewsArticle.objects.filter(
-            content_embedding__isnull=False,
-        ).select_related('source')
+            content_embedding_bin__isnull=False,
+        ).defer('content_embedding').select_related('source')
         total = articles_qs.count()
 
         if total == 0:
@@ -70,43 +82,55 @@ class Command(BaseCommand):
 
         self.stdout.write(f'Reindexing {total} articles (batch_size={batch_size}) …')
 
-        total_success = 0
-        total_failed = 0
-
-        for start in range(0, total, batch_size):
-            batch = list(articles_qs[start:start + batch_size])
-            es_docs = []
-
-            for article in batch:
-                es_docs.append({
+        def es_docs():
+            for article in articles_qs.iterator(chunk_size=500):
+                yield {
                     'article_id': article.id,
                     'title': article.title,
-                    'content': article.content[:10000],
+                    'content': article.content,  # truncated once in _bulk_action
                     'description': article.description,
                     'url': article.url,
                     'source': article.source.name if article.source else '',
                     'author': article.author,
                     'publish_date': article.publish_date.isoformat() if article.publish_date else None,
                     'scraped_at': article.scraped_at.isoformat() if article.scraped_at else None,
-                    'content_embedding': article.content_embedding,
-                })
+                    'content_embedding': np.frombuffer(
+                        article.content_embedding_bin, dtype=np.float32,
+                    ),
+                }
 
-            result = es.bulk_index_articles(es_docs)
-            total_success += result.get('success', 0)
-            total_failed += result.get('failed', 0)
-
-            # Update DB flags
-            article_ids = [a.id for a in batch]
-            now = timezone.now()
+        def flag_indexed(article_ids):
             NewsArticle.objects.filter(id__in=article_ids).update(
                 es_indexed=True,
-                es_index_date=now,
+                es_index_date=timezone.now(),
             )
 
-            self.stdout.write(
-                f'  … {min(start + batch_size, total)}/{total} '
-                f'(success={total_success}, failed={total_failed})'
-            )
+        total_success = 0
+        total_failed = 0
+        indexed_ids: list[int] = []
+
+        # Only documents ES acknowledged are flagged as indexed.
+        for ok, article_id in es.stream_index_articles(
+            es_docs(), chunk_size=batch_size, thread_count=threads, bulk_mode=True,
+        ):
+            if ok:
+                total_success += 1
+                indexed_ids.append(article_id)
+            else:
+                total_failed += 1
+
+            done = total_success + total_failed
+            if len(indexed_ids) >= batch_size:
+                flag_indexed(indexed_ids)
+                indexed_ids = []
+            if done % batch_size == 0:
+                self.stdout.write(
+                    f'  … {done}/{total} '
+                    f'(success={total_success}, failed={total_failed})'
+                )
+
+        if indexed_ids:
+            flag_indexed(indexed_ids)
 
         self.stdout.write(self.style.SUCCESS(
             f'\n✓ Reindexing complete: {total_success} success, {total_failed} failed.'
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-15 23:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("scraper", "0007_userkeyword_keyword_aliases_and_more"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="newssource",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["last_scraped"],
+                name="ns_active_oldest",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="newssource",
+            index=models.Index(
+                fields=["is_active", "scrape_interval_hours", "last_scraped"],
+                name="scraper_new_is_acti_25afb5_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-15 23:02
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    """Drop the legacy pre-Jina models; no active code reads or writes them."""
+
+    dependencies = [
+        ("scraper", "0008_newssource_scheduler_indexes"),
+    ]
+
+    # Referencing models first so each table is dropped after its dependents.
+    operations = [
+        migrations.DeleteModel(
+            name="Notification",
+        ),
+        migrations.DeleteModel(
+            name="KeywordArticleMatch",
+        ),
+        migrations.DeleteModel(
+            name="Keyword",
+        ),
+        migrations.DeleteModel(
+            name="Article",
+        ),
+        migrations.DeleteModel(
+            name="UserProfile",
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.18 on 2026-10-15 23:03
+
+from django.db import migrations, models
+
+
+def fill_embedding_bin(apps, schema_editor):
+    """Copy every existing JSON embedding into the float32 binary column."""
+    import numpy as np
+
+    NewsArticle = apps.get_model("scraper", "NewsArticle")
+    batch = []
+    qs = NewsArticle.objects.filter(content_embedding__isnull=False).only("id", "content_embedding")
+    for article in qs.iterator(chunk_size=1000):
+        article.content_embedding_bin = np.asarray(
+            article.content_embedding, dtype=np.float32,
+        ).tobytes()
+        batch.append(article)
+        if len(batch) >= 1000:
+            NewsArticle.objects.bulk_update(batch, ["content_embedding_bin"])
+            batch = []
+    if batch:
+        NewsArticle.objects.bulk_update(batch, ["content_embedding_bin"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("scraper", "0009_delete_legacy_models"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="newsarticle",
+            name="content_embedding_bin",
+            field=models.BinaryField(
+                blank=True,
+                help_text="float32 copy of content_embedding (3 KB, no JSON parsing)",
+                null=True,
+                verbose_name="Content Embedding (binary)",
+            ),
+        ),
+        migrations.RunPython(fill_embedding_bin, migrations.RunPython.noop),
+    ]
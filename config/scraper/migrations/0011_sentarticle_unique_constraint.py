@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-15 23:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("scraper", "0010_newsarticle_content_embedding_bin"),
+    ]
+
+    # Add the named constraint before dropping unique_together so the pair
+    # is never left unguarded.
+    operations = [
+        migrations.AddConstraint(
+            model_name="sentarticle",
+            constraint=models.UniqueConstraint(
+                fields=("user_id", "article"), name="uniq_user_article"
+            ),
+        ),
+        migrations.AlterUniqueTogether(
+            name="sentarticle",
+            unique_together=set(),
+        ),
+    ]
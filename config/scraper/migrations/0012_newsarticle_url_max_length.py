@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-15 23:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("scraper", "0011_sentarticle_unique_constraint"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="newsarticle",
+            name="article_link",
+            field=models.URLField(
+                blank=True,
+                default="",
+                help_text="Direct link to the original article",
+                max_length=500,
+                verbose_name="Article Link",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="newsarticle",
+            name="url",
+            field=models.URLField(
+                help_text="Unique article URL (prevents duplicates)",
+                max_length=500,
+                unique=True,
+                verbose_name="Article URL",
+            ),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-15 23:40
+
+from django.db import migrations
+
+
+def normalize_keyword_aliases(apps, schema_editor):
+    """Rewrite stored aliases as keyword first, then sorted, case-deduplicated."""
+    UserKeyword = apps.get_model("scraper", "UserKeyword")
+    batch = []
+    for uk in UserKeyword.objects.only("id", "keyword", "keyword_aliases").iterator(chunk_size=500):
+        if not uk.keyword_aliases:
+            continue
+        kw = uk.keyword.strip()
+        seen = {kw.lower()}
+        aliases = [kw]
+        for alias in sorted(a.strip() for a in uk.keyword_aliases):
+            if alias and alias.lower() not in seen:
+                seen.add(alias.lower())
+                aliases.append(alias)
+        if aliases != uk.keyword_aliases:
+            uk.keyword_aliases = aliases
+            batch.append(uk)
+    UserKeyword.objects.bulk_update(batch, ["keyword_aliases"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("scraper", "0012_newsarticle_url_max_length"),
+    ]
+
+    operations = [
+        migrations.RunPython(normalize_keyword_aliases, migrations.RunPython.noop),
+    ]
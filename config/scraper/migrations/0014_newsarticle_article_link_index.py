@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-16 00:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("scraper", "0013_normalize_keyword_aliases"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="newsarticle",
+            name="article_link",
+            field=models.URLField(
+                blank=True,
+                db_index=True,
+                default="",
+                help_text="Direct link to the original article",
+                max_length=500,
+                verbose_name="Article Link",
+            ),
+        ),
+    ]
@@ -6,115 +6,16 @@ Active models (Jina AI-powered):
     - NewsArticle: scraped articles with embeddings
     - UserKeyword: user keyword subscriptions with semantic embeddings
     - SentArticle: delivery tracking
-
-Legacy models (kept for migration compatibility, not used by active code):
-    - UserProfile, Keyword, Article, KeywordArticleMatch, Notification
 """
 
-from django.db import models
-from django.contrib.auth.models import User
-
-
-# =============================================================================
-# LEGACY MODELS — kept for migration compatibility, no longer used
-# =============================================================================
-
-
-class UserProfile(models.Model):
-    """Links a Django User to their Telegram chat for notifications."""
-
-    user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='profile', verbose_name="User")
-    telegram_chat_id = models.BigIntegerField(unique=True, null=True, blank=True, verbose_name="Telegram Chat ID")
-    created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
-
-    def __str__(self) -> str:
-        return f"{self.user.username} - {self.telegram_chat_id}"
-
-
-class Keyword(models.Model):
-    """Legacy keyword model for simple text-based matching."""
-
-    user = models.ForeignKey(User, on_delete=models.CASCADE, verbose_name="User")
-    keyword_name = models.CharField(max_length=255, verbose_name="Keyword Name", db_index=True)
-    created_at = models.DateTimeField(auto_now_add=True)
-
-    class Meta:
-        unique_together = ('user', 'keyword_name')
-        indexes = [
-            models.Index(fields=['user', 'keyword_name']),
-        ]
-
-    def __str__(self) -> str:
-        return f"{self.user.username} - {self.keyword_name}"
-
-
-class Article(models.Model):
-    """Legacy article model for simple scraping."""
-
-    title = models.CharField(max_length=255, verbose_name="Title", db_index=True)
-    content = models.TextField(verbose_name="Content")
-    url = models.URLField(unique=True, verbose_name="URL")
-    image_url = models.URLField(verbose_name="Image URL", null=True, blank=True)
-    date = models.CharField(max_length=100, verbose_name="Date")
-
-    class Meta:
-        indexes = [
-            models.Index(fields=['url']),
-        ]
-
-    def __str__(self) -> str:
-        return self.title
-
-
-class KeywordArticleMatch(models.Model):
-    """Legacy model linking keywords to matched articles."""
-
-    keyword = models.ForeignKey(Keyword, on_delete=models.CASCADE, related_name="keyword_article_matches", verbose_name="Keyword")
-    article = models.ForeignKey(Article, on_delete=models.CASCADE, related_name="keyword_matches", verbose_name="Article")
-    created_at = models.DateTimeField(auto_now_add=True)
+from __future__ import annotations
 
-    class Meta:
-        unique_together = ('keyword', 'article')
-        indexes = [
-            models.Index(fields=['keyword', 'article']),
-        ]
-
-    def __str__(self) -> str:
-        return f"{self.keyword} - {self.article}"
-
-
-class Notification(models.Model):
-    """Legacy notification model for user alerts."""
-
-    NOTIFICATION_STATUS_CHOICES = [
-        ('unread', 'Unread'),
-        ('read', 'Read'),
-        ('archived', 'Archived'),
-    ]
-
-    user = models.ForeignKey(User, on_delete=models.CASCADE, verbose_name="User")
-    keyword = models.ForeignKey(Keyword, on_delete=models.CASCADE, verbose_name="Keyword")
-    article = models.ForeignKey(Article, on_delete=models.CASCADE, verbose_name="Article")
-    status = models.CharField(
-        max_length=10,
-        choices=NOTIFICATION_STATUS_CHOICES,
-        default='unread',
-        verbose_name="Status"
-    )
-    created_at = models.DateTimeField(auto_now_add=True, verbose_name="Created At")
-    updated_at = models.DateTimeField(auto_now=True, verbose_name="Updated At")
-
-    class Meta:
-        ordering = ['-created_at']
-        unique_together = ('user', 'keyword', 'article')
-        indexes = [
-            models.Index(fields=['user', 'status', '-created_at']),
-            models.Index(fields=['user', '-created_at']),
-        ]
+import numpy as np
+from django.conf import settings
+from django.db import models
 
-    def __str__(self) -> str:
-        return f"Notification for {self.user.username} - {self.article.title}"
+# Expected embedding length, resolved once at import
+_EMB_DIM: int = getattr(settings, 'EMBEDDING_DIMENSION', 768)
 
 
 # =============================================================================
@@ -192,6 +93,15 @@ class NewsSource(models.Model):
         verbose_name = "News Source"
         verbose_name_plural = "News Sources"
         ordering = ['name']
+        indexes = [
+            # The beat scheduler only ever looks at active sources.
+            models.Index(
+                fields=['last_scraped'],
+                condition=models.Q(is_active=True),
+                name='ns_active_oldest',
+            ),
+            models.Index(fields=['is_active', 'scrape_interval_hours', 'last_scraped']),
+        ]
 
     def __str__(self) -> str:
         status = "✓" if self.is_active else "✗"
@@ -226,8 +136,8 @@ class NewsArticle(models.Model):
     title = models.CharField(max_length=500, verbose_name="Title")
     content = models.TextField(verbose_name="Full Content", help_text="Clean article text from Jina AI")
     description = models.TextField(blank=True, default='', verbose_name="Description", help_text="Meta description or summary")
-    url = models.URLField(unique=True, db_index=True, verbose_name="Article URL", help_text="Unique article URL (prevents duplicates)")
-    article_link = models.URLField(blank=True, default='', verbose_name="Article Link", help_text="Direct link to the original article")
+    url = models.URLField(max_length=500, unique=True, verbose_name="Article URL", help_text="Unique article URL (prevents duplicates)")
+    article_link = models.URLField(max_length=500, blank=True, default='', db_index=True, verbose_name="Article Link", help_text="Direct link to the original article")
     category = models.CharField(max_length=100, blank=True, default='', db_index=True, verbose_name="Category", help_text="News category (e.g. Nation, Business, Sports)")
     publish_date = models.DateTimeField(null=True, blank=True, db_index=True, verbose_name="Publish Date")
     author = models.CharField(max_length=200, blank=True, default='', verbose_name="Author")
@@ -237,6 +147,13 @@ class NewsArticle(models.Model):
         verbose_name="Content Embedding",
         help_text="768-dim vector from sentence-transformers, stored as JSON list",
     )
+    content_embedding_bin = models.BinaryField(
+        null=True,
+        blank=True,
+        editable=False,
+        verbose_name="Content Embedding (binary)",
+        help_text="float32 copy of content_embedding (3 KB, no JSON parsing)",
+    )
     es_indexed = models.BooleanField(
         default=False,
         verbose_name="ElasticSearch Indexed",
@@ -268,9 +185,16 @@ class NewsArticle(models.Model):
     @property
     def has_embedding(self) -> bool:
         """Check whether an embedding vector has been generated."""
-        from django.conf import settings as django_settings
-        dim = getattr(django_settings, 'EMBEDDING_DIMENSION', 768)
-        return self.content_embedding is not None and len(self.content_embedding) == dim
+        return self.content_embedding is not None and len(self.content_embedding) == _EMB_DIM
+
+    def set_content_embedding(self, vector: list[float] | np.ndarray | None) -> None:
+        """Set the embedding in both its JSON and binary form (not saved)."""
+        if vector is None:
+            self.content_embedding = self.content_embedding_bin = None
+            return
+        array = np.asarray(vector, dtype=np.float32)
+        self.content_embedding = array.tolist()
+        self.content_embedding_bin = array.tobytes()
 
 
 class UserKeyword(models.Model):
@@ -326,9 +250,24 @@ class UserKeyword(models.Model):
     @property
     def has_embedding(self) -> bool:
         """Check whether an embedding vector has been generated."""
-        from django.conf import settings as django_settings
-        dim = getattr(django_settings, 'EMBEDDING_DIMENSION', 768)
-        return self.keyword_embedding is not None and len(self.keyword_embedding) == dim
+        return self.keyword_embedding is not None and len(self.keyword_embedding) == _EMB_DIM
+
+
+class SentArticleQuerySet(models.QuerySet):
+    """QuerySet helpers for ``SentArticle``."""
+
+    def with_article(self) -> 'SentArticleQuerySet':
+        """
+        Join the delivered article and its source in the same query.
+
+        Use this wherever records are rendered (``__str__`` reads
+        ``article.title``) to avoid one extra SELECT per row.  The article
+        body and embedding are deferred since listings never show them.
+        """
+        return self.select_related('article', 'article__source').defer(
+            'article__content', 'article__content_embedding',
+            'article__content_embedding_bin',
+        )
 
 
 class SentArticle(models.Model):
@@ -371,10 +310,14 @@ class SentArticle(models.Model):
         help_text="Cosine similarity score (0.0 to 1.0)",
     )
 
+    objects = SentArticleQuerySet.as_manager()
+
     class Meta:
         verbose_name = "Sent Article"
         verbose_name_plural = "Sent Articles"
-        unique_together = ('user_id', 'article')
+        constraints = [
+            models.UniqueConstraint(fields=['user_id', 'article'], name='uniq_user_article'),
+        ]
         indexes = [
             models.Index(fields=['user_id', '-sent_at']),
         ]
@@ -13,19 +13,24 @@ This package contains the core service classes:
 # Lazy imports — each service is imported only when accessed,
 # so a missing dependency (e.g. langchain) won't break unrelated commands.
 
+_LAZY_SERVICES: dict[str, str] = {
+    'JinaScraperService': '.jina_scraper',
+    'LangChainProcessor': '.langchain_processor',
+    'EmbeddingService': '.embedding_service',
+    'ElasticSearchService': '.elasticsearch_service',
+    'NewsMatcherService': '.news_matcher',
+}
+
 
 def __getattr__(name: str):
-    _mapping = {
-        'JinaScraperService': '.jina_scraper',
-        'LangChainProcessor': '.langchain_processor',
-        'EmbeddingService': '.embedding_service',
-        'ElasticSearchService': '.elasticsearch_service',
-        'NewsMatcherService': '.news_matcher',
-    }
-    if name in _mapping:
+    if name in _LAZY_SERVICES:
         import importlib
-        module = importlib.import_module(_mapping[name], __package__)
-        return getattr(module, name)
+        module = importlib.import_module(_LAZY_SERVICES[name], __package__)
+        service = getattr(module, name)
+        # Bind it on the package so later lookups are plain attribute
+        # access and never reach this hook again.
+        globals()[name] = service
+        return service
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
@@ -19,9 +19,12 @@ Usage:
 
 from __future__ import annotations
 
+import contextlib
+import copy
 import logging
+import threading
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from typing import Any, Iterable, Iterator
 
 from django.conf import settings
 
@@ -31,6 +34,30 @@ INDEX_NAME: str = "news_articles"
 
 _EMBEDDING_DIM: int = getattr(settings, 'EMBEDDING_DIMENSION', 768)
 
+# Characters of article body kept in ``_source`` (full text stays in the DB)
+_MAX_CONTENT_CHARS: int = 10000
+
+# Upper bound on one bulk request body; chunk_size caps the document count
+_BULK_MAX_CHUNK_BYTES: int = 10 * 1024 * 1024
+_BULK_REQUEST_TIMEOUT: int = 60
+# Index settings applied while bulk_mode loads run, and what restores them
+_BULK_MODE_SETTINGS: dict[str, Any] = {
+    "index": {
+        "refresh_interval": "-1",
+        "translog.durability": "async",
+        "translog.flush_threshold_size": "1gb",
+    },
+}
+_DEFAULT_WRITE_SETTINGS: dict[str, Any] = {
+    "index": {
+        "refresh_interval": None,  # back to the ES default (1s)
+        "translog.durability": "request",
+        "translog.flush_threshold_size": None,
+    },
+}
+# >1 sends bulk chunks from that many threads (parallel_bulk)
+_BULK_THREADS: int = getattr(settings, 'ELASTICSEARCH_BULK_THREADS', 1)
+
 # Index mapping definition
 _INDEX_MAPPING: dict[str, Any] = {
     "mappings": {
@@ -52,6 +79,9 @@ _INDEX_MAPPING: dict[str, Any] = {
                 "dims": _EMBEDDING_DIM,
                 "index": True,
                 "similarity": "cosine",
+                # Scalar-quantised HNSW graph: ~4x less memory than float32.
+                # Dropped by create_index() on clusters older than 8.12.
+                "index_options": {"type": "int8_hnsw", "m": 16, "ef_construction": 100},
             },
         }
     },
@@ -61,6 +91,16 @@ _INDEX_MAPPING: dict[str, Any] = {
     },
 }
 
+# One client (and urllib3 pool) per host, shared by every service instance
+# in the process so keep-alive connections survive between tasks.
+_CLIENTS: dict[str, Any] = {}
+_CLIENTS_LOCK = threading.Lock()
+
+
+def _truncate(text: str, limit: int = _MAX_CONTENT_CHARS) -> str:
+    """Cut *text* to *limit* characters, without copying short strings."""
+    return text if len(text) <= limit else text[:limit]
+
 
 class ElasticSearchService:
     """
@@ -92,17 +132,17 @@ class ElasticSearchService:
     # ------------------------------------------------------------------
 
     def _init_client(self, **kwargs: Any) -> None:
-        """Create the ES client and test the connection."""
+        """Create (or reuse) the ES client and test the connection."""
         try:
-            from elasticsearch import Elasticsearch
-
-            # Build auth params if credentials are provided
-            es_user = getattr(settings, 'ELASTICSEARCH_USER', '')
-            es_pass = getattr(settings, 'ELASTICSEARCH_PASSWORD', '')
-            if es_user and es_pass and 'basic_auth' not in kwargs:
-                kwargs['basic_auth'] = (es_user, es_pass)
-
-            self.client = Elasticsearch(self.host, **kwargs)
+            # Callers passing their own client options get a private client.
+            shared = not kwargs
+            if shared:
+                with _CLIENTS_LOCK:
+                    self.client = _CLIENTS.get(self.host)
+                    if self.client is None:
+                        self.client = _CLIENTS[self.host] = self._build_client()
+            else:
+                self.client = self._build_client(**kwargs)
 
             if self.client.ping():
                 self._connected = True
@@ -118,6 +158,34 @@ class ElasticSearchService:
         except Exception:
             logger.exception("Failed to connect to ElasticSearch at %s", self.host)
 
+    def _build_client(self, **kwargs: Any) -> Any:
+        """Construct an ``Elasticsearch`` client with the project defaults."""
+        from elasticsearch import Elasticsearch
+
+        # Build auth params if credentials are provided
+        es_user = getattr(settings, 'ELASTICSEARCH_USER', '')
+        es_pass = getattr(settings, 'ELASTICSEARCH_PASSWORD', '')
+        if es_user and es_pass and 'basic_auth' not in kwargs:
+            kwargs['basic_auth'] = (es_user, es_pass)
+        if 'serializer' not in kwargs and 'serializers' not in kwargs:
+            try:
+                # orjson-backed JSON bodies; serialises numpy arrays natively
+                from elasticsearch.serializer import OrjsonSerializer
+
+                kwargs['serializer'] = OrjsonSerializer()
+            except ImportError:  # orjson missing or elasticsearch < 8.13
+                pass
+
+        # urllib3 keeps 10 connections per node by default; Celery
+        # workers and bulk helpers can use more than that concurrently.
+        kwargs.setdefault(
+            'connections_per_node', getattr(settings, 'ELASTICSEARCH_MAXSIZE', 32),
+        )
+        # gzip request bodies — float vectors compress several-fold
+        kwargs.setdefault('http_compress', True)
+
+        return Elasticsearch(self.host, **kwargs)
+
     @property
     def is_connected(self) -> bool:
         """Whether the ES client is connected and responsive."""
@@ -127,6 +195,22 @@ class ElasticSearchService:
     # Index management
     # ------------------------------------------------------------------
 
+    def _index_mapping(self) -> dict[str, Any]:
+        """Return ``_INDEX_MAPPING``, minus ``int8_hnsw`` if ES predates 8.12."""
+        try:
+            number = self.client.info()["version"]["number"]
+            version = tuple(int(part) for part in number.split("-")[0].split(".")[:2])
+        except Exception:
+            logger.warning("Could not read the ElasticSearch version; assuming 8.12+")
+            return _INDEX_MAPPING
+        if version >= (8, 12):
+            return _INDEX_MAPPING
+
+        mapping = copy.deepcopy(_INDEX_MAPPING)
+        del mapping["mappings"]["properties"]["content_embedding"]["index_options"]
+        logger.info("ElasticSearch %s has no int8_hnsw; using a float32 vector index", number)
+        return mapping
+
     def create_index(self, delete_existing: bool = False) -> bool:
         """
         Create the ``news_articles`` index with vector mapping.
@@ -150,7 +234,7 @@ class ElasticSearchService:
                 index_exists = False
 
             if not index_exists:
-                self.client.indices.create(index=INDEX_NAME, body=_INDEX_MAPPING)
+                self.client.indices.create(index=INDEX_NAME, body=self._index_mapping())
                 logger.info("Created ElasticSearch index '%s'", INDEX_NAME)
             else:
                 logger.info("Index '%s' already exists", INDEX_NAME)
@@ -160,6 +244,41 @@ class ElasticSearchService:
             logger.exception("Failed to create index '%s'", INDEX_NAME)
             return False
 
+    def reindex_to(self, new_index: str) -> int:
+        """
+        Copy every document into *new_index* server-side with ``_reindex``.
+
+        Use this when only the mapping changed (e.g. a new vector
+        ``index_options``): *new_index* is created with the current
+        mapping and ES copies ``_source`` itself, so no embeddings are
+        re-read from the database or re-sent over the network.
+
+        Args:
+            new_index: Name of the index to create and fill.
+
+        Returns:
+            Number of documents created, or ``-1`` on failure.
+        """
+        if not self.is_connected:
+            logger.error("Cannot reindex — not connected to ElasticSearch")
+            return -1
+
+        try:
+            self.client.indices.create(index=new_index, body=self._index_mapping())
+            result = self.client.options(request_timeout=3600).reindex(
+                source={"index": INDEX_NAME},
+                dest={"index": new_index},
+                slices="auto",
+                refresh=True,
+                wait_for_completion=True,
+            )
+            created = result.get("created", 0)
+            logger.info("Reindexed %d documents from '%s' into '%s'", created, INDEX_NAME, new_index)
+            return created
+        except Exception:
+            logger.exception("Failed to reindex '%s' into '%s'", INDEX_NAME, new_index)
+            return -1
+
     # ------------------------------------------------------------------
     # Indexing
     # ------------------------------------------------------------------
@@ -194,7 +313,7 @@ class ElasticSearchService:
         doc: dict[str, Any] = {
             "article_id": article_id,
             "title": title,
-            "content": content[:10000],  # Limit content size for ES
+            "content": _truncate(content),  # Limit content size for ES
             "description": metadata.get("description", ""),
             "url": metadata.get("url", ""),
             "source": metadata.get("source", ""),
@@ -212,15 +331,38 @@ class ElasticSearchService:
             logger.exception("Failed to index article %d", article_id)
             return False
 
-    def bulk_index_articles(self, articles: list[dict[str, Any]]) -> dict[str, int]:
+    @contextlib.contextmanager
+    def _bulk_mode(self, enabled: bool) -> Iterator[None]:
+        """Pause refreshes and fsync-per-request for the duration of a load."""
+        if not enabled:
+            yield
+            return
+        self.client.indices.put_settings(index=INDEX_NAME, settings=_BULK_MODE_SETTINGS)
+        try:
+            yield
+        finally:
+            try:
+                self.client.indices.put_settings(index=INDEX_NAME, settings=_DEFAULT_WRITE_SETTINGS)
+                self.client.indices.refresh(index=INDEX_NAME)
+            except Exception:
+                logger.exception("Failed to restore write settings on '%s'", INDEX_NAME)
+
+    def bulk_index_articles(
+        self,
+        articles: list[dict[str, Any]],
+        bulk_mode: bool = False,
+    ) -> dict[str, int]:
         """
         Bulk-index multiple articles (much faster than one-by-one).
 
         Each item in *articles* must contain at least ``article_id``, ``title``,
-        ``content``, and ``content_embedding``.
+        ``content``, and ``content_embedding``. Requests are streamed in
+        bounded chunks, so large lists never become one huge HTTP body.
 
         Args:
             articles: List of article dicts.
+            bulk_mode: Disable index refresh and use async translog
+                durability until the load finishes (backfills only).
 
         Returns:
             ``{'success': int, 'failed': int}``
@@ -232,42 +374,191 @@ class ElasticSearchService:
         if not articles:
             return {'success': 0, 'failed': 0}
 
+        success = 0
         try:
-            from elasticsearch.helpers import bulk
-
-            actions: list[dict[str, Any]] = []
-            for article in articles:
-                action = {
-                    "_index": INDEX_NAME,
-                    "_id": str(article["article_id"]),
-                    "_source": {
-                        "article_id": article["article_id"],
-                        "title": article.get("title", ""),
-                        "content": article.get("content", "")[:10000],
-                        "description": article.get("description", ""),
-                        "url": article.get("url", ""),
-                        "source": article.get("source", ""),
-                        "author": article.get("author", ""),
-                        "publish_date": article.get("publish_date"),
-                        "scraped_at": article.get("scraped_at", datetime.now(timezone.utc).isoformat()),
-                        "content_embedding": article.get("content_embedding", []),
-                    },
-                }
-                actions.append(action)
-
-            success, errors = bulk(self.client, actions, raise_on_error=False)
-            failed = len(errors) if isinstance(errors, list) else 0
-            logger.info(
-                "Bulk indexed %d articles (success=%d, failed=%d)",
-                len(articles),
-                success,
-                failed,
+            for ok, _article_id in self.stream_index_articles(articles, bulk_mode=bulk_mode):
+                success += ok
+        except Exception:
+            logger.exception("Bulk indexing failed for %d articles", len(articles))
+
+        failed = len(articles) - success
+        logger.info(
+            "Bulk indexed %d articles (success=%d, failed=%d)",
+            len(articles),
+            success,
+            failed,
+        )
+        return {'success': success, 'failed': failed}
+
+    def stream_index_articles(
+        self,
+        articles: Iterable[dict[str, Any]],
+        chunk_size: int = 500,
+        thread_count: int | None = None,
+        bulk_mode: bool = False,
+    ) -> Iterator[tuple[bool, int]]:
+        """
+        Index articles from an iterable via ``streaming_bulk``.
+
+        Unlike :meth:`bulk_index_articles` the input is consumed lazily, so
+        only a few *chunk_size* request bodies are held in memory at a time,
+        and the outcome is reported per document.
+
+        Args:
+            articles: Iterable of article dicts (same shape as for
+                :meth:`bulk_index_articles`).
+            chunk_size: Documents per bulk request.
+            thread_count: Send chunks from this many threads with
+                ``parallel_bulk``; results then arrive out of order.
+                Defaults to ``settings.ELASTICSEARCH_BULK_THREADS`` (1).
+            bulk_mode: Disable index refresh and use async translog
+                durability until the generator is exhausted or closed.
+
+        Yields:
+            ``(ok, article_id)`` for every document.
+        """
+        if not self.is_connected:
+            logger.error("Cannot stream-index — not connected to ElasticSearch")
+            return
+
+        from elasticsearch.helpers import parallel_bulk, streaming_bulk
+
+        client = self.client.options(request_timeout=_BULK_REQUEST_TIMEOUT)
+        actions = (self._bulk_action(article) for article in articles)
+        thread_count = thread_count or _BULK_THREADS
+        if thread_count > 1:
+            results = parallel_bulk(
+                client,
+                actions,
+                thread_count=thread_count,
+                chunk_size=chunk_size,
+                max_chunk_bytes=_BULK_MAX_CHUNK_BYTES,
+                queue_size=thread_count,
+                raise_on_error=False,
+                raise_on_exception=False,
+            )
+        else:
+            results = streaming_bulk(
+                client,
+                actions,
+                chunk_size=chunk_size,
+                max_chunk_bytes=_BULK_MAX_CHUNK_BYTES,
+                raise_on_error=False,
+                raise_on_exception=False,
             )
-            return {'success': success, 'failed': failed}
 
+        with self._bulk_mode(bulk_mode):
+            for ok, item in results:
+                result = next(iter(item.values()))
+                if not ok:
+                    logger.warning("Failed to index article %s: %s", result.get('_id'), result.get('error'))
+                yield ok, int(result['_id'])
+
+    @staticmethod
+    def _bulk_action(article: dict[str, Any]) -> dict[str, Any]:
+        """Build a bulk ``index`` action for one article dict."""
+        return {
+            "_index": INDEX_NAME,
+            "_id": str(article["article_id"]),
+            "_source": {
+                "article_id": article["article_id"],
+                "title": article.get("title", ""),
+                "content": _truncate(article.get("content") or ""),
+                "description": article.get("description", ""),
+                "url": article.get("url", ""),
+                "source": article.get("source", ""),
+                "author": article.get("author", ""),
+                "publish_date": article.get("publish_date"),
+                "scraped_at": article.get("scraped_at", datetime.now(timezone.utc).isoformat()),
+                "content_embedding": article.get("content_embedding", []),
+            },
+        }
+
+    # ------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------
+
+    def search_by_embedding(
+        self,
+        embedding: list[float],
+        top_k: int = 10,
+        num_candidates: int = 100,
+    ) -> list[dict[str, Any]]:
+        """
+        Return the articles nearest to *embedding* (approximate kNN).
+
+        Args:
+            embedding: Query vector.
+            top_k: Number of hits to return.
+            num_candidates: HNSW candidates examined per shard.
+
+        Returns:
+            Hits as ``{'article_id', 'score', 'title', 'url', 'source'}``
+            dicts, best first; ``[]`` on error or when disconnected.
+        """
+        return self.batch_vector_search([embedding], top_k, num_candidates)[0]
+
+    def batch_vector_search(
+        self,
+        queries: list[list[float]],
+        top_k: int = 10,
+        num_candidates: int = 100,
+    ) -> list[list[dict[str, Any]]]:
+        """
+        Run several kNN searches in one ``_msearch`` round-trip.
+
+        Args:
+            queries: Query vectors.
+            top_k: Number of hits per query.
+            num_candidates: HNSW candidates examined per shard.
+
+        Returns:
+            One hit list per query, in order (see :meth:`search_by_embedding`).
+            A query that failed on the ES side gets ``[]``.
+        """
+        empty: list[list[dict[str, Any]]] = [[] for _ in queries]
+        if not self.is_connected:
+            logger.error("Cannot search — not connected to ElasticSearch")
+            return empty
+        if not queries:
+            return empty
+
+        searches: list[dict[str, Any]] = []
+        for vector in queries:
+            searches.append({"index": INDEX_NAME})
+            searches.append({
+                "knn": {
+                    "field": "content_embedding",
+                    "query_vector": vector,
+                    "k": top_k,
+                    "num_candidates": max(num_candidates, top_k),
+                },
+                "size": top_k,
+                "_source": ["article_id", "title", "url", "source"],
+            })
+
+        try:
+            responses = self.client.msearch(searches=searches)["responses"]
         except Exception:
-            logger.exception("Bulk indexing failed for %d articles", len(articles))
-            return {'success': 0, 'failed': len(articles)}
+            logger.exception("Vector msearch failed for %d queries", len(queries))
+            return empty
+
+        results = empty
+        for i, response in enumerate(responses):
+            if "error" in response:
+                logger.warning("Vector search %d failed: %s", i, response["error"])
+                continue
+            results[i] = [
+                {
+                    "article_id": hit["_source"].get("article_id"),
+                    "score": hit["_score"],
+                    "title": hit["_source"].get("title", ""),
+                    "url": hit["_source"].get("url", ""),
+                    "source": hit["_source"].get("source", ""),
+                }
+                for hit in response["hits"]["hits"]
+            ]
+        return results
 
     # ------------------------------------------------------------------
     # Maintenance
@@ -296,7 +587,15 @@ class ElasticSearchService:
                     }
                 }
             }
-            result = self.client.delete_by_query(index=INDEX_NAME, body=body)
+            # One slice per shard runs in parallel; docs updated mid-sweep
+            # are skipped rather than aborting the whole request.
+            result = self.client.options(request_timeout=300).delete_by_query(
+                index=INDEX_NAME,
+                body=body,
+                slices="auto",
+                conflicts="proceed",
+                refresh=False,
+            )
             deleted = result.get("deleted", 0)
             logger.info("Deleted %d articles older than %d days from ES", deleted, days)
             return deleted
@@ -21,17 +21,59 @@ Usage:
 
 from __future__ import annotations
 
+import contextlib
+import hashlib
 import logging
+import math
+import threading
+from collections import OrderedDict
 from typing import Any
 
 import numpy as np
 from django.conf import settings
 
+try:
+    # Optional: fused SIMD cosine kernels (AVX2/AVX-512/NEON).  The NumPy
+    # path below gives the same results when it is not installed.
+    import simsimd
+except ImportError:  # pragma: no cover - optional dependency
+    simsimd = None
+
+try:
+    # Optional: JIT-compiled single-pass cosine, used when SimSIMD is absent.
+    from numba import njit
+except ImportError:  # pragma: no cover - optional dependency
+    njit = None
+
 logger = logging.getLogger('scraper')
 
 # Model name — multilingual, 768 dims, open-source
 _MODEL_NAME: str = getattr(settings, 'EMBEDDING_MODEL', 'paraphrase-multilingual-mpnet-base-v2')
 _EMBEDDING_DIM: int = getattr(settings, 'EMBEDDING_DIMENSION', 768)
+# 'auto' = float16 on CUDA, float32 on CPU; 'bf16' also halves CPU inference;
+# 'fp32' disables reduced precision everywhere
+_PRECISION: str = getattr(settings, 'EMBEDDING_PRECISION', 'auto')
+# Texts per forward pass in get_embeddings_batch; None picks 128 (GPU) / 16 (CPU)
+_BATCH_SIZE: int | None = getattr(settings, 'EMBEDDING_BATCH_SIZE', None)
+# Recently encoded texts kept in memory (0 disables the cache)
+_CACHE_SIZE: int = getattr(settings, 'EMBEDDING_CACHE_SIZE', 4096)
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _cosine_kernel(a, b):  # pragma: no cover - compiled
+        """dot, |a|² and |b|² in one fused pass (float64 accumulators)."""
+        dot = aa = bb = 0.0
+        for i in range(a.shape[0]):
+            ai = a[i]
+            bi = b[i]
+            dot += ai * bi
+            aa += ai * ai
+            bb += bi * bi
+        if aa == 0.0 or bb == 0.0:
+            return 0.0
+        return dot / math.sqrt(aa * bb)
+else:  # pragma: no cover - optional dependency
+    _cosine_kernel = None
 
 
 class EmbeddingService:
@@ -52,6 +94,10 @@ class EmbeddingService:
 
     _instance: EmbeddingService | None = None
     _model: Any = None  # SentenceTransformer instance
+    _cache: OrderedDict[bytes, np.ndarray] = OrderedDict()  # LRU, oldest first
+    _cache_lock = threading.Lock()
+    _inference_mode: Any = contextlib.nullcontext  # torch.inference_mode once loaded
+    _device: str = 'cpu'
 
     def __new__(cls) -> EmbeddingService:
         if cls._instance is None:
@@ -69,8 +115,16 @@ class EmbeddingService:
             from sentence_transformers import SentenceTransformer
 
             logger.info("Loading embedding model: %s …", _MODEL_NAME)
-            self._model = SentenceTransformer(_MODEL_NAME)
-            logger.info("Embedding model loaded successfully (%d dims)", _EMBEDDING_DIM)
+            import torch
+
+            self._device = 'cuda' if torch.cuda.is_available() else 'cpu'
+            self._model = SentenceTransformer(_MODEL_NAME, device=self._device)
+            self._model.eval()
+            self._inference_mode = torch.inference_mode
+            self._apply_precision(torch)
+            logger.info(
+                "Embedding model loaded successfully (%d dims, %s)", _EMBEDDING_DIM, self._device,
+            )
         except ImportError:
             logger.error(
                 "sentence-transformers is not installed. "
@@ -81,43 +135,119 @@ class EmbeddingService:
             logger.exception("Failed to load embedding model '%s'", _MODEL_NAME)
             raise
 
+    def _apply_precision(self, torch: Any) -> None:
+        """Cast the model to float16 (CUDA) or bfloat16 (CPU, opt-in)."""
+        if _PRECISION == 'fp32':
+            return
+        if self._device == 'cuda':
+            dtype = torch.float16
+        elif _PRECISION == 'bf16':
+            dtype = torch.bfloat16
+        else:
+            return
+        try:
+            self._model.to(dtype)
+            logger.info("Embedding model running in %s", dtype)
+        except Exception:
+            logger.warning("Could not switch embedding model to %s; using float32", dtype, exc_info=True)
+            self._model.float()
+
+    def _encode(self, inputs: str | list[str], **kwargs: Any) -> np.ndarray:
+        """Run the model without autograd bookkeeping; always float32 out."""
+        with self._inference_mode():
+            output = self._model.encode(
+                inputs,
+                show_progress_bar=False,
+                convert_to_numpy=True,
+                device=self._device,
+                **kwargs,
+            )
+        return np.ascontiguousarray(output, dtype=np.float32)
+
+    # ------------------------------------------------------------------
+    # Query cache
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _cache_key(text: str) -> bytes:
+        return hashlib.blake2b(text.strip().encode(), digest_size=16).digest()
+
+    def _cache_get(self, key: bytes) -> np.ndarray | None:
+        with self._cache_lock:
+            vector = self._cache.get(key)
+            if vector is not None:
+                self._cache.move_to_end(key)
+            return vector
+
+    def _cache_put(self, key: bytes, vector: np.ndarray) -> None:
+        if _CACHE_SIZE <= 0:
+            return
+        vector.setflags(write=False)  # shared between callers
+        with self._cache_lock:
+            self._cache[key] = vector
+            self._cache.move_to_end(key)
+            while len(self._cache) > _CACHE_SIZE:
+                self._cache.popitem(last=False)
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
 
-    def get_embedding(self, text: str) -> list[float]:
+    def get_embedding_np(self, text: str) -> np.ndarray:
         """
-        Generate a single embedding vector for the given text.
+        Generate a single unit-length embedding as a float32 array.
+
+        The vector is L2-normalised, so cosine similarity against other
+        embeddings from this service is a plain dot product. The array may
+        be shared through the query cache and is read-only.
 
         Args:
             text: Input text (any language).
 
         Returns:
-            A list of floats representing the embedding (dimension set by settings).
-
-        Raises:
-            ValueError: If text is empty or the model failed.
+            A contiguous float32 array (dimension set by settings); all
+            zeros if *text* is empty or the model failed.
         """
         if not text or not text.strip():
             logger.warning("get_embedding called with empty text")
-            return [0.0] * _EMBEDDING_DIM
+            return np.zeros(_EMBEDDING_DIM, dtype=np.float32)
+
+        key = self._cache_key(text)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
 
         try:
-            embedding = self._model.encode(text, show_progress_bar=False)
-            result = embedding.tolist()
+            embedding = self._encode(text, normalize_embeddings=True)
 
             # Validate dimensions
-            if len(result) != _EMBEDDING_DIM:
+            if embedding.shape != (_EMBEDDING_DIM,):
                 logger.error(
                     "Unexpected embedding dimension: got %d, expected %d",
-                    len(result),
+                    embedding.size,
                     _EMBEDDING_DIM,
                 )
+            else:
+                self._cache_put(key, embedding)
 
-            return result
+            return embedding
         except Exception:
             logger.exception("Failed to generate embedding for text: '%s…'", text[:50])
-            return [0.0] * _EMBEDDING_DIM
+            return np.zeros(_EMBEDDING_DIM, dtype=np.float32)
+
+    def get_embedding(self, text: str) -> list[float]:
+        """
+        Generate a single embedding vector for the given text.
+
+        Thin list-returning wrapper around :meth:`get_embedding_np`.
+
+        Args:
+            text: Input text (any language).
+
+        Returns:
+            A list of floats representing the embedding (dimension set by settings).
+        """
+        return self.get_embedding_np(text).tolist()
 
     def get_embeddings_batch(self, texts: list[str]) -> list[list[float]]:
         """
@@ -145,7 +275,12 @@ class EmbeddingService:
 
         try:
             logger.info("Generating batch embeddings for %d texts …", len(valid_texts))
-            embeddings = self._model.encode(valid_texts, show_progress_bar=False, batch_size=32)
+            # sentence-transformers already length-sorts each call to
+            # minimise padding, so the texts are passed as-is.
+            batch_size = _BATCH_SIZE or (128 if self._device == 'cuda' else 16)
+            embeddings = self._encode(
+                valid_texts, batch_size=batch_size, normalize_embeddings=True,
+            )
 
             # Build result array with zeros for empty texts
             result: list[list[float]] = [[0.0] * _EMBEDDING_DIM for _ in texts]
@@ -171,68 +306,118 @@ class EmbeddingService:
             Values > 0.7 indicate a strong semantic match.
         """
         try:
-            a = np.array(embedding1, dtype=np.float32)
-            b = np.array(embedding2, dtype=np.float32)
-
-            # Handle zero vectors
-            norm_a = np.linalg.norm(a)
-            norm_b = np.linalg.norm(b)
-            if norm_a == 0 or norm_b == 0:
+            # asarray: no copy when callers already pass float32 arrays
+            a = np.asarray(embedding1, dtype=np.float32)
+            b = np.asarray(embedding2, dtype=np.float32)
+
+            if simsimd is not None and a.shape == b.shape:
+                # simsimd reports two zero vectors as identical
+                if not a.any() or not b.any():
+                    return 0.0
+                similarity = 1.0 - float(simsimd.cosine(a, b))
+                return max(0.0, min(1.0, similarity))
+
+            if _cosine_kernel is not None and a.shape == b.shape:
+                similarity = float(_cosine_kernel(a, b))
+                return max(0.0, min(1.0, similarity))
+
+            # Squared norms via vdot — one BLAS dot each, no linalg.norm
+            # dispatch.  Handle zero vectors.
+            aa = float(np.vdot(a, a))
+            bb = float(np.vdot(b, b))
+            if aa == 0 or bb == 0:
                 return 0.0
 
-            similarity = float(np.dot(a, b) / (norm_a * norm_b))
+            similarity = float(np.dot(a, b)) / math.sqrt(aa * bb)
             # Clamp to [0, 1] (rounding errors can push slightly outside)
             return max(0.0, min(1.0, similarity))
         except Exception:
             logger.exception("Similarity calculation failed")
             return 0.0
 
+    @staticmethod
+    def normalize_embeddings(embeddings: Any) -> np.ndarray:
+        """
+        L2-normalise a corpus once so later searches reduce to a dot product.
+
+        Args:
+            embeddings: 2-D array-like of vectors (one per row).
+
+        Returns:
+            A C-contiguous float32 matrix of unit rows (zero rows stay zero),
+            suitable for ``find_similar_texts(..., normalized=True)``.
+        """
+        matrix = np.ascontiguousarray(embeddings, dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        return matrix / np.maximum(norms, 1e-12)
+
+    @staticmethod
+    def _select_top_k(
+        similarities: np.ndarray, threshold: float, top_k: int,
+    ) -> list[dict[str, Any]]:
+        """
+        Pick the *top_k* scores at or above *threshold*, best first.
+
+        Thresholding is a boolean mask and selection an O(N)
+        ``argpartition``; only the surviving *top_k* rows are sorted.
+        """
+        if top_k <= 0:
+            return []
+        idxs = np.flatnonzero(similarities >= threshold)
+        if idxs.size > top_k:
+            part = np.argpartition(similarities[idxs], -top_k)[-top_k:]
+            idxs = idxs[np.sort(part)]
+        idxs = idxs[np.argsort(-similarities[idxs], kind='stable')]
+        return [{'index': int(i), 'score': float(similarities[i])} for i in idxs]
+
     def find_similar_texts(
         self,
         query_embedding: list[float],
-        corpus_embeddings: list[list[float]],
+        corpus_embeddings: list[list[float]] | np.ndarray,
         threshold: float = 0.7,
         top_k: int = 10,
+        normalized: bool = False,
     ) -> list[dict[str, Any]]:
         """
         Find the most similar texts from a corpus of embeddings.
 
         Args:
             query_embedding: The query embedding vector.
-            corpus_embeddings: List of corpus vectors.
+            corpus_embeddings: List of corpus vectors, or a matrix from
+                :meth:`normalize_embeddings`.
             threshold: Minimum cosine similarity to include.
             top_k: Maximum number of results to return.
+            normalized: ``True`` if *corpus_embeddings* already has unit
+                rows; the search is then a single matrix-vector product
+                with no per-call corpus norms.
 
         Returns:
             A list of dicts ``{'index': int, 'score': float}`` sorted by
             descending similarity, filtered by *threshold*.
         """
-        if not corpus_embeddings:
+        if len(corpus_embeddings) == 0:
             return []
 
         try:
-            query = np.array(query_embedding, dtype=np.float32)
-            corpus = np.array(corpus_embeddings, dtype=np.float32)
+            query = np.asarray(query_embedding, dtype=np.float32)
+            corpus = np.asarray(corpus_embeddings, dtype=np.float32)
 
             # Compute cosine similarities in bulk
             query_norm = np.linalg.norm(query)
             if query_norm == 0:
                 return []
 
-            corpus_norms = np.linalg.norm(corpus, axis=1)
-            # Avoid division by zero
-            corpus_norms[corpus_norms == 0] = 1e-10
-
-            similarities = np.dot(corpus, query) / (corpus_norms * query_norm)
-
-            # Filter by threshold and sort
-            results: list[dict[str, Any]] = []
-            for idx, score in enumerate(similarities):
-                if score >= threshold:
-                    results.append({'index': idx, 'score': float(score)})
-
-            results.sort(key=lambda x: x['score'], reverse=True)
-            return results[:top_k]
+            if normalized:
+                # Unit rows: cosine == dot, one sgemv over the corpus.
+                similarities = corpus @ (query / query_norm)
+            elif simsimd is not None:
+                # One fused pass per row; zero rows come back as distance 1.
+                distances = np.asarray(simsimd.cdist(query[None, :], corpus, metric='cosine'))
+                similarities = 1.0 - distances.ravel()
+            else:
+                similarities = self.normalize_embeddings(corpus) @ (query / query_norm)
+
+            return self._select_top_k(similarities, threshold, top_k)
 
         except Exception:
             logger.exception("find_similar_texts failed")
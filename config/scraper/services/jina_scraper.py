@@ -20,14 +20,53 @@ Usage:
 
 from __future__ import annotations
 
+import hashlib
+import io
 import logging
 import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Optional
 from urllib.parse import urljoin, urlparse
 
 import requests
 from django.conf import settings
+from django.core.cache import cache
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import InvalidHeader
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+from .text_patterns import first_char_guard
+
+try:
+    # Optional: faster JSON parsing of Reader responses; its decode error
+    # subclasses ValueError, so the markdown fallback still triggers.
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - optional dependency
+    from json import loads as _json_loads
+
+try:
+    # Optional: Aho-Corasick automaton (C) for multi-phrase substring search.
+    import ahocorasick
+except ImportError:  # pragma: no cover - optional dependency
+    ahocorasick = None
+
+try:
+    # Optional: local extraction from raw HTML for FAST_SCRAPE_DOMAINS
+    # (selectolax for <head> metadata, trafilatura for the article body).
+    import trafilatura
+    from selectolax.parser import HTMLParser
+except ImportError:  # pragma: no cover - optional dependency
+    trafilatura = None
+    HTMLParser = None
+
+try:
+    # Optional: Hyperscan scans for all date formats in one pass
+    import hyperscan
+except ImportError:  # pragma: no cover - optional dependency
+    hyperscan = None
 
 logger = logging.getLogger('scraper')
 
@@ -37,6 +76,42 @@ _DEFAULT_TIMEOUT: int = getattr(settings, 'SCRAPE_TIMEOUT', 30)
 # Maximum articles to scrape from a single homepage
 _MAX_ARTICLES: int = getattr(settings, 'MAX_ARTICLES_PER_SCRAPE', 20)
 
+# How long a successfully scraped article is served from the Django cache
+# (seconds; 0 disables).  Retries and task re-runs then skip Jina entirely.
+_ARTICLE_CACHE_TTL: int = getattr(settings, 'JINA_ARTICLE_CACHE_TTL', 60 * 60)
+
+# Domains whose article pages are fetched directly and extracted locally
+# (no Jina round-trip).  Subdomains match too; Jina remains the fallback.
+_FAST_SCRAPE_DOMAINS: tuple[str, ...] = tuple(
+    d.lower() for d in getattr(settings, 'FAST_SCRAPE_DOMAINS', ())
+)
+
+# Fast-path extractions shorter than this fall back to Jina
+_FAST_MIN_CONTENT_CHARS: int = 200
+
+# Number of article pages fetched concurrently per homepage scrape
+_SCRAPE_WORKERS: int = getattr(settings, 'SCRAPE_MAX_WORKERS', 4)
+
+# Connection pool sizing for the shared HTTP session.  Nearly all traffic goes
+# to the Jina Reader host, so keeping connections alive between requests saves
+# a full TCP + TLS handshake per article.
+_POOL_CONNECTIONS: int = 8
+_POOL_MAXSIZE: int = 32
+
+# Default headers for every Reader request.  ``ACCEPT_ENCODING`` lists only
+# the codings urllib3 can decode here (gzip/deflate, plus br/zstd when the
+# optional decoders are installed), so compressed bodies are always readable.
+_SESSION_HEADERS: dict[str, str] = {
+    'User-Agent': 'MediaTrends/1.0',
+    'Accept-Encoding': ACCEPT_ENCODING,
+}
+
+# Upper bound on a single Reader response body.  Bodies are streamed in
+# chunks and the read is abandoned once this is exceeded, so a runaway page
+# cannot balloon a worker's memory.
+_MAX_RESPONSE_BYTES: int = 8 * 1024 * 1024
+_READ_CHUNK_SIZE: int = 64 * 1024
+
 # Known boilerplate / site-wide meta descriptions that should be replaced
 # with an auto-extracted summary from the article content.
 _BOILERPLATE_DESCRIPTIONS: list[str] = [
@@ -46,6 +121,21 @@ _BOILERPLATE_DESCRIPTIONS: list[str] = [
     'dünya və yerli xəbərlərin tək ünvanı',
 ]
 
+
+def _build_automaton(phrases: list[str]) -> Any:
+    """Compile *phrases* into one Aho-Corasick automaton (needs pyahocorasick)."""
+    automaton = ahocorasick.Automaton()
+    for phrase in phrases:
+        automaton.add_word(phrase, phrase)
+    automaton.make_automaton()
+    return automaton
+
+
+# Finds any boilerplate phrase in one pass; ``None`` without pyahocorasick
+_BOILERPLATE_AUTOMATON: Any = (
+    _build_automaton(_BOILERPLATE_DESCRIPTIONS) if ahocorasick is not None else None
+)
+
 # Patterns that indicate a line is website footer / boilerplate text
 # (address, copyright, contact info, social links, etc.).
 # These appear on EVERY page and must not be used for keyword matching.
@@ -68,6 +158,237 @@ _FOOTER_PATTERNS: list[re.Pattern[str]] = [
     re.compile(r'(?i)bizi\s+(izləyin|sosial)', re.UNICODE),
 ]
 
+# Publish-date formats, tried in order (first match wins)
+_DATE_PATTERNS: list[re.Pattern[str]] = [
+    # 2024-01-15, 2024/01/15
+    re.compile(r'(\d{4}[-/]\d{1,2}[-/]\d{1,2})', re.IGNORECASE),
+    # 15 January 2024, 15 Jan 2024
+    re.compile(
+        r'(\d{1,2}\s+(?:January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{4})',
+        re.IGNORECASE,
+    ),
+    # January 15, 2024
+    re.compile(
+        r'((?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+\d{4})',
+        re.IGNORECASE,
+    ),
+    # 15.01.2024
+    re.compile(r'(\d{1,2}\.\d{1,2}\.\d{4})', re.IGNORECASE),
+]
+
+
+def _build_date_database(patterns: list[re.Pattern[str]]) -> Any:
+    """Compile *patterns* into one Hyperscan block-mode database.
+
+    ``\\s`` is widened to Python's whitespace set (UCP omits the
+    ``\\x1c``-``\\x1f`` separators) so the database never misses a date
+    that ``re`` would find.
+    """
+    database = hyperscan.Database()
+    database.compile(
+        expressions=[
+            p.pattern.replace(r'\s', r'[\s\x1c-\x1f]').encode('utf-8') for p in patterns
+        ],
+        ids=list(range(len(patterns))),
+        elements=len(patterns),
+        flags=[
+            hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_UTF8
+            | hyperscan.HS_FLAG_UCP | hyperscan.HS_FLAG_SINGLEMATCH
+        ] * len(patterns),
+    )
+    return database
+
+
+# All date formats in one database; ``None`` without hyperscan
+_DATE_DATABASE: Any = _build_date_database(_DATE_PATTERNS) if hyperscan is not None else None
+
+# Hyperscan scratch space may not be shared between threads
+_DATE_SCRATCH = threading.local()
+
+# Author bylines: "By Name", "Author: Name", "Müəllif: Ad"
+_AUTHOR_PATTERNS: list[re.Pattern[str]] = [
+    re.compile(r'(?:By|Author|Written by|Reporter)[:\s]+([A-Z][a-zA-ZÇçĞğİıÖöŞşÜü\s\-\.]{2,40})'),
+    re.compile(r'(?:Müəllif|Jurnalist)[:\s]+([A-ZÇĞİÖŞÜ][a-zA-ZçğıöşüÇĞİÖŞÜ\s\-\.]{2,40})'),
+]
+
+# Article-body cleanup
+# Lines starting with these are markup (heading, list, link, image, rule),
+# never the first paragraph of an article body
+_SKIP_PREFIXES: tuple[str, ...] = ('#', '*', '[', '!', '---')
+_BLANK_LINES_RE: re.Pattern[str] = re.compile(r'\n{3,}')
+# Every junk line of an article body, removed from the whole text by one
+# ``re.sub`` (together with its newline) rather than tested line by line.
+# Conditions apply to the line with surrounding whitespace stripped, hence
+# the ``_HWS`` padding; ``\s`` inside footer phrases must not cross lines.
+#   ![image](...)
+#   * [Short nav item](...)                                   (under 80 chars)
+#   ### [Some other article title](https://sia.az/az/news/...)
+#   [A line that is entirely one markdown link](https://...)  (under 200 chars)
+#   Sidebar category headers: "Siyasət 21:07", "Dünya 20:34"
+#   Footer / boilerplate lines (address, copyright, contact) — see above
+_HWS: str = r'[^\S\n]'
+# Footer matching is only attempted at line starts and where a footer
+# pattern can begin, which skips most positions of ordinary prose.
+_FOOTER_GUARD: str = first_char_guard(_FOOTER_PATTERNS)
+_FOOTER_ALTERNATION: str = '|'.join(
+    f'(?:{pat.pattern.removeprefix("(?i)")})'.replace(r'\s', _HWS)
+    for pat in _FOOTER_PATTERNS
+)
+_JUNK_LINES_RE: re.Pattern[str] = re.compile(
+    rf'^(?:'
+    rf'{_HWS}*(?:'
+    rf'!\[.*'
+    rf'|\*(?=.*\[)(?=.*\]\()(?=.{{0,78}}(?<!\s){_HWS}*$).*'
+    rf'|#{{1,6}}{_HWS}*\[.+\]\(https?://.+\)'
+    rf'|(?=.{{1,199}}(?<!\s){_HWS}*$)\[.+\]\(https?://.+\)'
+    rf'|[A-ZÇĞİÖŞÜА-Я][a-zA-ZçğıöşüÇĞİÖŞÜа-яА-Я\-]+{_HWS}+\d{{1,2}}:\d{{2}}'
+    rf'){_HWS}*$'
+    rf'|(?=.*?(?i:{_FOOTER_GUARD}(?:{_FOOTER_ALTERNATION})))'
+    rf').*(?:\n|\Z)',
+    re.MULTILINE,
+)
+_BOLD_RE: re.Pattern[str] = re.compile(r'\*\*(.+?)\*\*')
+_MARKDOWN_LINK_TEXT_RE: re.Pattern[str] = re.compile(r'\[([^\]]+)\]\([^)]+\)')
+_MARKDOWN_MARKUP_RE: re.Pattern[str] = re.compile(r'[#*\[\]!]')
+# Path segments with 3+ digits are article ids / files, not categories
+_LONG_NUMBER_RE: re.Pattern[str] = re.compile(r'\d{3,}')
+
+# Homepage link extraction — compiled once instead of per scrape / per link.
+_MARKDOWN_LINK_RE: re.Pattern[str] = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+_MEDIA_LINK_TEXT_RE: re.Pattern[str] = re.compile(
+    r'\.(webp|jpg|jpeg|png|gif|svg|avif|mp4|pdf)\b', re.IGNORECASE,
+)
+_DIGIT_RE: re.Pattern[str] = re.compile(r'\d')
+# Root-relative hrefs that urljoin would return unchanged behind the base
+# origin: no dot or empty segments, query, fragment, params or whitespace
+_PLAIN_PATH_RE: re.Pattern[str] = re.compile(r'(?!.*/\.)(?!.*//)/[^?#;\s]*')
+# Host of an absolute http(s) href (everything up to the path/query/fragment)
+_URL_HOST_RE: re.Pattern[str] = re.compile(r'https?://([^/?#]*)')
+_WHITESPACE_RE: re.Pattern[str] = re.compile(r'\s')
+
+# Non-article link targets (images, media, static resources), matched on the
+# extension after the last dot with any query string / fragment removed
+_SKIP_EXTENSIONS: frozenset[str] = frozenset({
+    'jpg', 'jpeg', 'png', 'gif', 'svg', 'webp', 'avif', 'ico',
+    'css', 'js', 'pdf', 'mp3', 'mp4', 'avi', 'mov', 'wmv',
+    'zip', 'rar', 'exe', 'woff', 'woff2', 'ttf', 'eot',
+})
+_SKIP_HREF_PREFIXES: tuple[str, ...] = ('#', 'mailto:', 'javascript:')
+
+
+class _TokenBucket:
+    """
+    Thread-safe adaptive token bucket: at most *rate* requests per second on
+    average, with bursts of up to *capacity*.
+
+    Replaces a fixed sleep after every request, which throttled each worker
+    even when the others were idle.  Responses are fed back through
+    :meth:`feedback`: a 429/503 or ``Retry-After`` halves the rate and pauses
+    all requests for the advertised delay; successful responses raise the
+    rate back towards its ceiling.
+    """
+
+    # Throttling never pushes the rate below ceiling / _MIN_RATE_DIVISOR
+    _MIN_RATE_DIVISOR: float = 16.0
+    # Fraction of the ceiling regained per successful response
+    _RECOVERY_STEP: float = 0.05
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.max_rate = rate
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                else:
+                    # No tokens accrue while paused
+                    elapsed = now - max(self._updated, self._paused_until)
+                    self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+                    self._updated = now
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def feedback(self, response: requests.Response) -> None:
+        """Adapt the rate to the server's reaction to the last request."""
+        retry_after = self._retry_after(response)
+        with self._lock:
+            if response.status_code in (429, 503) or retry_after is not None:
+                self.rate = max(self.max_rate / self._MIN_RATE_DIVISOR, self.rate / 2)
+                self._tokens = 0.0
+                if retry_after:
+                    self._paused_until = max(self._paused_until, time.monotonic() + retry_after)
+                logger.warning(
+                    "Reader throttled (HTTP %d) — rate now %.2f req/s, pausing %.1fs",
+                    response.status_code, self.rate, retry_after or 0.0,
+                )
+            elif response.ok:
+                self.rate = min(self.max_rate, self.rate + self.max_rate * self._RECOVERY_STEP)
+                if response.headers.get('X-RateLimit-Remaining') == '0':
+                    self._tokens = 0.0
+
+    @staticmethod
+    def _retry_after(response: requests.Response) -> float | None:
+        """``Retry-After`` in seconds (delta or HTTP date), or ``None``."""
+        value = response.headers.get('Retry-After')
+        if not value:
+            return None
+        try:
+            return Retry().parse_retry_after(value)
+        except InvalidHeader:
+            return None
+
+
+# Process-wide Reader request budget, shared by all scrape threads
+_RATE_LIMITER = _TokenBucket(
+    rate=getattr(settings, 'JINA_REQUESTS_PER_SECOND', 5),
+    capacity=getattr(settings, 'JINA_REQUESTS_PER_SECOND', 5),
+)
+
+
+_SESSION: requests.Session | None = None
+
+
+def _get_session() -> requests.Session:
+    """
+    Return the process-wide pooled HTTP session, creating it on first use.
+
+    ``JinaScraperService`` is instantiated once per Celery task, so a
+    per-instance session would throw away its keep-alive connections after
+    every scrape.  Sharing one session lets consecutive tasks in the same
+    worker reuse them.
+    """
+    global _SESSION
+    if _SESSION is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=_POOL_CONNECTIONS,
+            pool_maxsize=_POOL_MAXSIZE,
+            # Retry only connection failures — a read timeout already
+            # waited the full ``SCRAPE_TIMEOUT``.
+            max_retries=Retry(total=2, connect=2, read=0, backoff_factor=0.3),
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        session.headers.update(_SESSION_HEADERS)
+        _SESSION = session
+    return _SESSION
+
+
+class ResponseTooLargeError(requests.exceptions.RequestException):
+    """Raised when a Reader response body exceeds ``_MAX_RESPONSE_BYTES``."""
+
 
 class JinaScraperService:
     """
@@ -93,12 +414,12 @@ class JinaScraperService:
 
     def __init__(self, api_key: str | None = None) -> None:
         self.api_key = api_key or getattr(settings, 'JINA_API_KEY', '')
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'MediaTrends/1.0',
-        })
+        self.session = _get_session()
+        # Per-instance headers — the session is shared, so the API key must
+        # not be stored on it.
+        self.headers: dict[str, str] = {}
         if self.api_key:
-            self.session.headers['Authorization'] = f'Bearer {self.api_key}'
+            self.headers['Authorization'] = f'Bearer {self.api_key}'
 
     # ------------------------------------------------------------------
     # Public API
@@ -110,6 +431,7 @@ class JinaScraperService:
 
         Uses ``Accept: application/json`` so Jina returns structured data
         with the **real** page title, description, and clean content.
+        Successful results are cached for ``JINA_ARTICLE_CACHE_TTL`` seconds.
 
         Args:
             url: The target URL to scrape.
@@ -120,18 +442,39 @@ class JinaScraperService:
             ``title``, ``content``, ``description``, ``url``,
             ``publish_date``, ``author``, ``success`` (bool).
         """
+        if _ARTICLE_CACHE_TTL <= 0:
+            return self._scrape_url_json(url, options)
+
+        cache_key = self._article_cache_key(url, options)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            logger.debug("Serving %s from the article cache", url)
+            return cached
+
+        result = self._scrape_url_json(url, options)
+        if result.get('success'):
+            cache.set(cache_key, result, _ARTICLE_CACHE_TTL)
+        return result
+
+    def _scrape_url_json(self, url: str, options: dict[str, Any] | None = None) -> dict[str, Any]:
+        """Fetch and parse *url* in Jina JSON mode (no caching)."""
         jina_url = f"{self.JINA_READER_URL}{url}"
         logger.info("Scraping URL via Jina AI (JSON): %s", url)
 
         try:
-            headers = {'Accept': 'application/json'}
-            response = self.session.get(
+            headers = {**self.headers, 'Accept': 'application/json'}
+            _RATE_LIMITER.acquire()
+            with self.session.get(
                 jina_url, timeout=_DEFAULT_TIMEOUT,
-                params=options or {}, headers=headers,
-            )
-            response.raise_for_status()
+                params=options or {}, headers=headers, stream=True,
+            ) as response:
+                _RATE_LIMITER.feedback(response)
+                response.raise_for_status()
+                body = self._read_body(response)
 
-            data = response.json()
+            # Parsing raw bytes skips requests' charset sniffing over the
+            # whole body (json.loads detects UTF-8/16/32; orjson is UTF-8).
+            data = _json_loads(body)
 
             # Jina JSON response: {"code": 200, "data": {"title": ..., "content": ..., ...}}
             jina_data = data.get('data', {})
@@ -166,7 +509,9 @@ class JinaScraperService:
                 'content': cleaned_content,
                 'description': description[:1000] if description else '',
                 'url': jina_data.get('url', url),
-                'article_link': jina_data.get('url', url),
+                # The link as found on the homepage, which the known-link
+                # filter in scrape_multiple_articles compares against
+                'article_link': url,
                 'publish_date': publish_date,
                 'author': author,
                 'category': category,
@@ -187,20 +532,44 @@ class JinaScraperService:
             logger.error("Request error scraping %s: %s", url, exc)
             return self._error_result(url, str(exc))
 
+    @staticmethod
+    def _read_body(response: requests.Response) -> bytes:
+        """
+        Read a streamed response body in chunks, up to ``_MAX_RESPONSE_BYTES``.
+
+        Raises:
+            ResponseTooLargeError: If the body exceeds the size limit.
+        """
+        chunks: list[bytes] = []
+        size = 0
+        for chunk in response.iter_content(chunk_size=_READ_CHUNK_SIZE):
+            size += len(chunk)
+            if size > _MAX_RESPONSE_BYTES:
+                raise ResponseTooLargeError(
+                    f"Response body exceeds {_MAX_RESPONSE_BYTES} bytes",
+                    response=response,
+                )
+            chunks.append(chunk)
+        return b''.join(chunks)
+
     def _scrape_url_markdown(self, url: str, options: dict[str, Any] | None = None) -> dict[str, Any]:
         """
         Fallback: scrape a URL using markdown mode and parse manually.
         """
         jina_url = f"{self.JINA_READER_URL}{url}"
         try:
-            headers = {'Accept': 'text/markdown'}
-            response = self.session.get(
+            headers = {**self.headers, 'Accept': 'text/markdown'}
+            _RATE_LIMITER.acquire()
+            with self.session.get(
                 jina_url, timeout=_DEFAULT_TIMEOUT,
-                params=options or {}, headers=headers,
-            )
-            response.raise_for_status()
-
-            markdown = response.text
+                params=options or {}, headers=headers, stream=True,
+            ) as response:
+                _RATE_LIMITER.feedback(response)
+                response.raise_for_status()
+                body = self._read_body(response)
+                encoding = response.encoding or 'utf-8'
+
+            markdown = body.decode(encoding, errors='replace')
             if not markdown or len(markdown.strip()) < 50:
                 return self._error_result(url, "Empty markdown content")
 
@@ -216,8 +585,9 @@ class JinaScraperService:
         Scrape a news homepage and then each linked article.
 
         1. Fetches the homepage via Jina AI to get markdown.
-        2. Extracts article links from the markdown.
-        3. Scrapes each article individually (up to ``MAX_ARTICLES_PER_SCRAPE``).
+        2. Extracts article links from the markdown and drops those already
+           stored as a ``NewsArticle``.
+        3. Scrapes the new articles concurrently (up to ``MAX_ARTICLES_PER_SCRAPE``).
 
         Args:
             base_url: The homepage URL of the news source.
@@ -240,23 +610,163 @@ class JinaScraperService:
         if not article_urls:
             return []
 
-        # Step 3 — Scrape each article via JSON mode (gets real title)
-        articles: list[dict[str, Any]] = []
-        for idx, article_url in enumerate(article_urls[:_MAX_ARTICLES]):
-            logger.info("Scraping article %d/%d: %s", idx + 1, min(len(article_urls), _MAX_ARTICLES), article_url)
-            result = self.scrape_url(article_url)  # uses JSON mode → correct title
-            if result.get('success'):
-                articles.append(result)
-            # Be polite — small delay between requests
-            time.sleep(1)
+        # Drop links that are already stored — on a recurring scrape most of
+        # the homepage is old news, and each skipped link saves a full Jina
+        # round-trip.  One query covers the whole list.  Jina may store an
+        # article under its canonical URL, so the homepage link kept in
+        # ``article_link`` is checked too.
+        from django.db.models import Q
+
+        from scraper.models import NewsArticle
+
+        known_urls: set[str] = set()
+        for stored_url, stored_link in NewsArticle.objects.filter(
+            Q(url__in=article_urls) | Q(article_link__in=article_urls),
+        ).values_list('url', 'article_link'):
+            known_urls.add(stored_url)
+            known_urls.add(stored_link)
+        total_links = len(article_urls)
+        article_urls = [u for u in article_urls if u not in known_urls]
+        logger.info(
+            "%d new article URLs on %s (%d already stored)",
+            len(article_urls), base_url, total_links - len(article_urls),
+        )
+        if not article_urls:
+            return []
+
+        # Step 3 — Scrape each article via JSON mode (gets real title).
+        # Fetches are network-bound and independent, so run them on a small
+        # thread pool sharing the pooled session; results keep link order.
+        article_urls = article_urls[:_MAX_ARTICLES]
+        total = len(article_urls)
+
+        def _scrape(item: tuple[int, str]) -> dict[str, Any]:
+            idx, article_url = item
+            logger.info("Scraping article %d/%d: %s", idx + 1, total, article_url)
+            if self._use_fast_path(article_url):
+                result = self.scrape_url_fast(article_url)
+                if result.get('success'):
+                    return result
+                logger.debug("Fast path failed for %s, using Jina", article_url)
+            # uses JSON mode → correct title; politeness is enforced by
+            # the shared rate limiter rather than a per-request sleep
+            return self.scrape_url(article_url)
+
+        with ThreadPoolExecutor(max_workers=_SCRAPE_WORKERS) as executor:
+            results = list(executor.map(_scrape, enumerate(article_urls)))
+
+        articles = [result for result in results if result.get('success')]
 
         logger.info("Successfully scraped %d articles from %s", len(articles), base_url)
         return articles
 
+    def scrape_url_fast(self, url: str) -> dict[str, Any]:
+        """
+        Scrape an article from its raw HTML without calling Jina.
+
+        Meant for sites with stable, server-rendered layouts listed in
+        ``FAST_SCRAPE_DOMAINS``.  Requires the optional ``selectolax`` and
+        ``trafilatura`` packages; when they are missing, or the extracted
+        body is too short, an error result is returned so the caller can
+        fall back to :meth:`scrape_url`.
+
+        Returns:
+            A dict with the same schema as ``scrape_url``.
+        """
+        if trafilatura is None:
+            return self._error_result(url, "Fast-path extractors not installed")
+
+        logger.info("Scraping URL directly: %s", url)
+        try:
+            with self.session.get(url, timeout=_DEFAULT_TIMEOUT, stream=True) as response:
+                response.raise_for_status()
+                body = self._read_body(response)
+                charset = self._header_charset(response)
+        except requests.exceptions.RequestException as exc:
+            logger.warning("Direct fetch failed for %s: %s", url, exc)
+            return self._error_result(url, str(exc))
+
+        # Only a charset the server actually sent is trusted: for bare
+        # ``text/html`` requests assumes ISO-8859-1, which garbles UTF-8
+        # pages that declare their charset in <meta> only.  Without one the
+        # raw bytes go to the extractors, which detect the encoding from the
+        # document itself.
+        html: str | bytes = body
+        if charset:
+            try:
+                html = body.decode(charset, errors='replace')
+            except LookupError:
+                logger.debug("Unknown charset %r for %s", charset, url)
+        try:
+            content = trafilatura.extract(
+                html, include_comments=False, include_tables=False, favor_precision=True,
+            ) or ''
+        except Exception as exc:
+            logger.warning("Local extraction failed for %s: %s", url, exc)
+            return self._error_result(url, str(exc))
+
+        content = content.strip()
+        if len(content) < _FAST_MIN_CONTENT_CHARS:
+            return self._error_result(url, "Extracted content too short")
+
+        tree = HTMLParser(html, detect_encoding=True, use_meta_tags=True)
+        title = self._meta_content(tree, 'meta[property="og:title"]')
+        if not title and tree.css_first('title') is not None:
+            title = tree.css_first('title').text(strip=True)
+        description = (
+            self._meta_content(tree, 'meta[property="og:description"]')
+            or self._meta_content(tree, 'meta[name="description"]')
+        )
+        if self._is_boilerplate_description(description):
+            description = self._extract_description_from_content(content)
+
+        return {
+            'title': title[:500],
+            'content': content,
+            'description': description[:1000],
+            'url': url,
+            'article_link': url,
+            'publish_date': self._extract_publish_date(content),
+            'author': self._extract_author(content),
+            'category': self._extract_category_from_url(url),
+            'success': True,
+        }
+
     # ------------------------------------------------------------------
     # Private helpers
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _use_fast_path(url: str) -> bool:
+        """Whether *url* belongs to a ``FAST_SCRAPE_DOMAINS`` site."""
+        if not _FAST_SCRAPE_DOMAINS or trafilatura is None:
+            return False
+        host = (urlparse(url).hostname or '').lower()
+        return any(host == d or host.endswith('.' + d) for d in _FAST_SCRAPE_DOMAINS)
+
+    @staticmethod
+    def _header_charset(response: requests.Response) -> str | None:
+        """The ``charset`` of the Content-Type header, if the server sent one."""
+        content_type = response.headers.get('Content-Type', '')
+        if 'charset=' not in content_type.lower():
+            return None
+        return response.encoding
+
+    @staticmethod
+    def _meta_content(tree: Any, selector: str) -> str:
+        """Stripped ``content`` attribute of the first node matching *selector*."""
+        node = tree.css_first(selector)
+        if node is None:
+            return ''
+        return (node.attributes.get('content') or '').strip()
+
+    @staticmethod
+    def _article_cache_key(url: str, options: dict[str, Any] | None) -> str:
+        """Cache key for a scraped article (URL plus any Reader options)."""
+        raw = url if not options else f"{url}?{sorted(options.items())!r}"
+        digest = hashlib.blake2b(raw.encode('utf-8'), digest_size=16).hexdigest()
+        return f'jina:article:{digest}'
+
     def _parse_jina_markdown(self, markdown: str, original_url: str) -> dict[str, Any]:
         """
         Parse Jina AI's markdown response into a structured dict.
@@ -272,34 +782,31 @@ class JinaScraperService:
             Dict with ``title``, ``content``, ``description``, ``url``,
             ``publish_date``, ``author``.
         """
-        lines = markdown.strip().split('\n')
-
-        # --- Title: first H1 heading ---
+        # --- Title (first H1 heading) and description (first substantial
+        # paragraph) in one pass, stopping once both are found ---
         title = ''
-        for line in lines:
-            stripped = line.strip()
-            if stripped.startswith('# '):
-                title = stripped.lstrip('# ').strip()
-                break
-        if not title:
-            # Fallback: first non-empty line
-            for line in lines:
-                if line.strip():
-                    title = line.strip()[:200]
-                    break
-
-        # --- Description: first substantial paragraph ---
+        first_line = ''
         description = ''
-        for line in lines:
+        for line in markdown.strip().split('\n'):
             stripped = line.strip()
-            if stripped and not stripped.startswith('#') and len(stripped) > 40:
+            if not stripped:
+                continue
+            if not first_line:
+                first_line = stripped[:200]
+            if stripped.startswith('#'):
+                if not title and stripped.startswith('# '):
+                    title = stripped.lstrip('# ').strip()
+            elif not description and len(stripped) > 40:
                 description = stripped[:500]
+            if title and description:
                 break
+        if not title:
+            # Fallback: first non-empty line
+            title = first_line
 
-        # --- Publish date: regex patterns ---
+        # --- Publish date / author: whole-text searches, since a date such
+        # as "15\nJanuary 2024" may span lines and pattern order matters ---
         publish_date = self._extract_publish_date(markdown)
-
-        # --- Author ---
         author = self._extract_author(markdown)
 
         # --- Content: full markdown, cleaned ---
@@ -334,41 +841,56 @@ class JinaScraperService:
         """
         parsed_base = urlparse(base_url)
         base_domain = parsed_base.netloc.removeprefix('www.')
+        # Origin that root-relative paths are appended to without urljoin
+        base_origin = (
+            f'{parsed_base.scheme}://{parsed_base.netloc}'
+            if parsed_base.scheme in ('http', 'https') and parsed_base.netloc
+            else None
+        )
 
         # Find all markdown links: [text](url)
-        link_pattern = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
-        matches = link_pattern.findall(markdown)
+        matches = _MARKDOWN_LINK_RE.findall(markdown)
 
         seen: set[str] = set()
         urls: list[str] = []
 
-        _SKIP_EXTENSIONS = (
-            '.jpg', '.jpeg', '.png', '.gif', '.svg', '.webp', '.avif', '.ico',
-            '.css', '.js', '.pdf', '.mp3', '.mp4', '.avi', '.mov', '.wmv',
-            '.zip', '.rar', '.exe', '.woff', '.woff2', '.ttf', '.eot',
-        )
-
         for link_text, href in matches:
-            href_lower = href.lower()
             # Skip non-article links (images, media, anchors, resources)
-            if any(href_lower.endswith(ext) for ext in _SKIP_EXTENSIONS):
+            _, dot, extension = href.partition('?')[0].partition('#')[0].rpartition('.')
+            if dot and extension.lower() in _SKIP_EXTENSIONS:
                 continue
-            if href.startswith('#') or href.startswith('mailto:') or href.startswith('javascript:'):
+            if href.startswith(_SKIP_HREF_PREFIXES):
                 continue
             # Skip if the link text itself looks like a media filename
-            if re.search(r'\.(webp|jpg|jpeg|png|gif|svg|avif|mp4|pdf)\b', link_text, re.IGNORECASE):
-                continue
-
-            # Resolve relative URLs
-            absolute_url = urljoin(base_url, href)
-            parsed_link = urlparse(absolute_url)
-
-            # Same-domain filter (handle www vs non-www)
-            link_domain = parsed_link.netloc.removeprefix('www.')
-            if link_domain != base_domain:
+            if _MEDIA_LINK_TEXT_RE.search(link_text):
                 continue
 
-            path = parsed_link.path
+            if base_origin is not None and _PLAIN_PATH_RE.fullmatch(href):
+                # Most homepage links: same host by construction, and the
+                # href already is the path
+                absolute_url = base_origin + href
+                path = href
+            else:
+                # Reject other-site links before paying for urljoin
+                host_match = _URL_HOST_RE.match(href)
+                if (
+                    host_match
+                    and host_match.group(1)
+                    and not _WHITESPACE_RE.search(href)
+                    and host_match.group(1).removeprefix('www.') != base_domain
+                ):
+                    continue
+
+                # Resolve relative URLs
+                absolute_url = urljoin(base_url, href)
+                parsed_link = urlparse(absolute_url)
+
+                # Same-domain filter (handle www vs non-www)
+                link_domain = parsed_link.netloc.removeprefix('www.')
+                if link_domain != base_domain:
+                    continue
+
+                path = parsed_link.path
 
             # Skip homepage itself
             if path in ('/', ''):
@@ -377,7 +899,7 @@ class JinaScraperService:
             # ARTICLE FILTER: real article URLs contain digits
             # e.g. /nation/254198.html, /business/12345, /news/2024/01/article-slug
             # Category pages like /nation/, /business/ do NOT contain digits
-            if not re.search(r'\d', path):
+            if not _DIGIT_RE.search(path):
                 continue
 
             # Skip very short paths
@@ -397,22 +919,44 @@ class JinaScraperService:
 
         Returns an ISO-format string or ``None``.
         """
-        date_patterns = [
-            # 2024-01-15, 2024/01/15
-            r'(\d{4}[-/]\d{1,2}[-/]\d{1,2})',
-            # 15 January 2024, 15 Jan 2024
-            r'(\d{1,2}\s+(?:January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{4})',
-            # January 15, 2024
-            r'((?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+\d{4})',
-            # 15.01.2024
-            r'(\d{1,2}\.\d{1,2}\.\d{4})',
-        ]
-        for pattern in date_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        patterns = _DATE_PATTERNS
+        if _DATE_DATABASE is not None:
+            try:
+                data = text.encode('utf-8')
+            except UnicodeEncodeError:  # lone surrogates: not valid UTF-8
+                data = None
+            if data is not None:
+                patterns = JinaScraperService._scan_date_formats(data)
+
+        for pattern in patterns:
+            match = pattern.search(text)
             if match:
                 return match.group(1).strip()
         return None
 
+    @staticmethod
+    def _scan_date_formats(data: bytes) -> list[re.Pattern[str]]:
+        """
+        Return the date patterns that occur in *data*, in priority order.
+
+        One Hyperscan pass reports which formats occur at all, so ``re``
+        only runs for those to pick out the match.
+        """
+        found: set[int] = set()
+
+        def _on_match(pattern_id: int, start: int, end: int, flags: int, context: Any) -> bool:
+            found.add(pattern_id)
+            return pattern_id == 0  # nothing outranks the first format
+
+        scratch = getattr(_DATE_SCRATCH, 'scratch', None)
+        if scratch is None:
+            scratch = _DATE_SCRATCH.scratch = hyperscan.Scratch(_DATE_DATABASE)
+        try:
+            _DATE_DATABASE.scan(data, match_event_handler=_on_match, scratch=scratch)
+        except hyperscan.ScanTerminated:
+            pass
+        return [_DATE_PATTERNS[i] for i in sorted(found)]
+
     @staticmethod
     def _extract_author(text: str) -> str:
         """
@@ -420,12 +964,8 @@ class JinaScraperService:
 
         Looks for patterns like "By Author Name" or "Author: Name".
         """
-        author_patterns = [
-            r'(?:By|Author|Written by|Reporter)[:\s]+([A-Z][a-zA-ZÇçĞğİıÖöŞşÜü\s\-\.]{2,40})',
-            r'(?:Müəllif|Jurnalist)[:\s]+([A-ZÇĞİÖŞÜ][a-zA-ZçğıöşüÇĞİÖŞÜ\s\-\.]{2,40})',
-        ]
-        for pattern in author_patterns:
-            match = re.search(pattern, text)
+        for pattern in _AUTHOR_PATTERNS:
+            match = pattern.search(text)
             if match:
                 return match.group(1).strip()
         return ''
@@ -439,7 +979,7 @@ class JinaScraperService:
         preserving meaningful structure.
         """
         # Collapse 3+ consecutive blank lines into 2
-        cleaned = re.sub(r'\n{3,}', '\n\n', markdown)
+        cleaned = _BLANK_LINES_RE.sub('\n\n', markdown)
         return cleaned.strip()
 
     @staticmethod
@@ -453,57 +993,29 @@ class JinaScraperService:
         link to other stories on the same site.  If those links mention
         keywords the user tracks, they cause false-positive matches.
         """
-        lines = content.split('\n')
-
         # Find the first substantial paragraph (not heading, link, list, image, >60 chars)
+        # Lines are read lazily: the scan usually stops within the first few
+        # lines, so the whole article is never split into a list.
         body_start = 0
-        for i, line in enumerate(lines):
+        offset = 0
+        for line in io.StringIO(content, newline='\n'):
             stripped = line.strip()
             if (
                 stripped
-                and not stripped.startswith('#')
-                and not stripped.startswith('*')
-                and not stripped.startswith('[')
-                and not stripped.startswith('!')
-                and not stripped.startswith('---')
+                and not stripped.startswith(_SKIP_PREFIXES)
                 and '======' not in stripped
                 and '------' not in stripped
                 and len(stripped) > 60
             ):
-                body_start = i
+                body_start = offset
                 break
+            offset += len(line)
 
-        body_lines = lines[body_start:]
-
-        # Remove junk lines: images, nav-style list items, and related-article links
-        cleaned_lines: list[str] = []
-        for line in body_lines:
-            stripped = line.strip()
-            # Skip image lines
-            if stripped.startswith('!['):
-                continue
-            # Skip short nav-style list items with links
-            if stripped.startswith('*') and '[' in stripped and '](' in stripped and len(stripped) < 80:
-                continue
-            # Skip markdown headings that are entirely a link to another article
-            # e.g. ### [Some other article title](https://sia.az/az/news/...)
-            if re.match(r'^#{1,6}\s*\[.+\]\(https?://.+\)\s*$', stripped):
-                continue
-            # Skip standalone link lines (entire line is a markdown link)
-            if re.match(r'^\[.+\]\(https?://.+\)\s*$', stripped) and len(stripped) < 200:
-                continue
-            # Skip lines that look like sidebar category headers
-            # e.g. "Siyasət 21:07", "Dünya 20:34"
-            if re.match(r'^[A-ZÇĞİÖŞÜА-Я][a-zA-ZçğıöşüÇĞİÖŞÜа-яА-Я\-]+\s+\d{1,2}:\d{2}$', stripped):
-                continue
-            # Skip footer / boilerplate lines (address, copyright, contact)
-            if any(pat.search(stripped) for pat in _FOOTER_PATTERNS):
-                continue
-            cleaned_lines.append(line)
-
-        result = '\n'.join(cleaned_lines)
-        result = re.sub(r'\n{3,}', '\n\n', result)
-        return result.strip()
+        # Drop junk lines (images, nav-style list items, related-article
+        # links, sidebar headers, footer boilerplate) in one C-level pass,
+        # then collapse the blank runs they leave behind.
+        cleaned = _JUNK_LINES_RE.sub('', content[body_start:])
+        return _BLANK_LINES_RE.sub('\n\n', cleaned).strip()
 
     @staticmethod
     def _extract_category_from_url(url: str) -> str:
@@ -531,7 +1043,7 @@ class JinaScraperService:
                 return ''
 
         # Skip if it looks like a file (e.g. 254198.html)
-        if re.search(r'\d{3,}', candidate):
+        if _LONG_NUMBER_RE.search(candidate):
             return ''
 
         return candidate.replace('-', ' ').replace('_', ' ').title()
@@ -547,6 +1059,8 @@ class JinaScraperService:
         if not description:
             return False
         desc_lower = description.lower().strip()
+        if _BOILERPLATE_AUTOMATON is not None:
+            return next(_BOILERPLATE_AUTOMATON.iter(desc_lower), None) is not None
         return any(phrase in desc_lower for phrase in _BOILERPLATE_DESCRIPTIONS)
 
     @staticmethod
@@ -556,23 +1070,19 @@ class JinaScraperService:
         Takes the first substantial paragraph (>60 chars, not a heading
         or link) as the description.
         """
-        for line in content.split('\n'):
+        for line in io.StringIO(content, newline='\n'):
             stripped = line.strip()
             if (
                 stripped
-                and not stripped.startswith('#')
-                and not stripped.startswith('[')
-                and not stripped.startswith('!')
-                and not stripped.startswith('*')
-                and not stripped.startswith('---')
+                and not stripped.startswith(_SKIP_PREFIXES)
                 and len(stripped) > 60
             ):
                 # Remove markdown formatting
-                cleaned = re.sub(r'\*\*(.+?)\*\*', r'\1', stripped)
-                cleaned = re.sub(r'\[([^\]]+)\]\([^)]+\)', r'\1', cleaned)
+                cleaned = _BOLD_RE.sub(r'\1', stripped)
+                cleaned = _MARKDOWN_LINK_TEXT_RE.sub(r'\1', cleaned)
                 return cleaned[:max_len]
         # Fallback: first 500 chars of content, stripped of markdown
-        fallback = re.sub(r'[#*\[\]!]', '', content).strip()
+        fallback = _MARKDOWN_MARKUP_RE.sub('', content).strip()
         return fallback[:max_len] if fallback else ''
 
     @staticmethod
@@ -15,6 +15,7 @@ Usage:
 
 from __future__ import annotations
 
+import functools
 import logging
 from typing import Any
 
@@ -34,6 +35,17 @@ logger = logging.getLogger('scraper')
 _CHUNK_THRESHOLD: int = 2000
 
 
+@functools.lru_cache(maxsize=16)
+def _get_splitter(chunk_size: int, chunk_overlap: int) -> RecursiveCharacterTextSplitter:
+    """Shared splitter per configuration; ``split_text`` keeps no state."""
+    return RecursiveCharacterTextSplitter(
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
+        separators=["\n\n", "\n", " ", ""],
+        length_function=len,
+    )
+
+
 class LangChainProcessor:
     """
     Process and split long articles using LangChain.
@@ -50,12 +62,7 @@ class LangChainProcessor:
     def __init__(self, chunk_size: int = 1000, chunk_overlap: int = 200) -> None:
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
-        self.text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=chunk_size,
-            chunk_overlap=chunk_overlap,
-            separators=["\n\n", "\n", " ", ""],
-            length_function=len,
-        )
+        self.text_splitter = _get_splitter(chunk_size, chunk_overlap)
         logger.debug(
             "LangChainProcessor initialized (chunk_size=%d, overlap=%d)",
             chunk_size,
@@ -83,13 +90,10 @@ class LangChainProcessor:
             - ``chunks``: List of chunk strings (empty if no splitting).
             - ``needs_chunking``: Whether the content was split.
         """
-        title: str = article_data.get('title', '')
-        content: str = article_data.get('content', '')
+        title: str = (article_data.get('title') or '').strip()
+        content: str = (article_data.get('content') or '').strip()
 
-        # Combine title and content for processing
-        combined_text = f"{title}\n\n{content}".strip()
-
-        if not combined_text:
+        if not title and not content:
             logger.warning("Empty article received for processing")
             return {
                 'processed_content': '',
@@ -97,6 +101,10 @@ class LangChainProcessor:
                 'needs_chunking': False,
             }
 
+        # Combine title and content for processing (one concatenation; the
+        # parts are already stripped)
+        combined_text = f"{title}\n\n{content}" if title and content else title or content
+
         if len(combined_text) < _CHUNK_THRESHOLD:
             logger.debug(
                 "Article '%s' is short (%d chars) — no chunking needed",
@@ -136,14 +144,9 @@ class LangChainProcessor:
         Returns:
             List of LangChain Document objects.
         """
-        documents: list[Document] = []
-        for article in articles:
-            content = article.get('content', '')
-            if not content:
-                continue
-
-            doc = Document(
-                page_content=f"{article.get('title', '')}\n\n{content}".strip(),
+        documents: list[Document] = [
+            Document(
+                page_content=f"{article.get('title', '')}\n\n{article['content']}".strip(),
                 metadata={
                     'title': article.get('title', ''),
                     'url': article.get('url', ''),
@@ -152,7 +155,9 @@ class LangChainProcessor:
                     'author': article.get('author', ''),
                 },
             )
-            documents.append(doc)
+            for article in articles
+            if article.get('content')
+        ]
 
         logger.info("Created %d LangChain documents from %d articles", len(documents), len(articles))
         return documents
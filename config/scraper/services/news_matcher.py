@@ -24,13 +24,23 @@ Usage:
 
 from __future__ import annotations
 
+import functools
 import logging
 import re
+from collections.abc import Iterable
 from datetime import timedelta
 from typing import Any
 
 from django.utils import timezone
 
+from .text_patterns import first_char_guard
+
+try:
+    # Optional: Aho-Corasick automaton (C) — all aliases in one text pass
+    import ahocorasick
+except ImportError:  # pragma: no cover - optional dependency
+    ahocorasick = None
+
 logger = logging.getLogger('scraper')
 
 # Footer / boilerplate patterns — lines matching these are NOT real article
@@ -49,6 +59,43 @@ _FOOTER_PATTERNS: list[re.Pattern[str]] = [
     re.compile(r'(?i)bizi\s+(izləyin|sosial)', re.UNICODE),
 ]
 
+# All footer patterns as one alternation: a single regex scan per line
+# instead of one per pattern.  Every pattern is case-insensitive, so the
+# inline ``(?i)`` flags (only legal at the start) are lifted to the whole.
+# Branches are only tried at the line start and where a pattern can begin
+# (see ``first_char_guard``) — without that guard the alternation is
+# slower than the separate searches.
+_FOOTER_RE: re.Pattern[str] = re.compile(
+    first_char_guard(_FOOTER_PATTERNS) + '(?:'
+    + '|'.join(f'(?:{pat.pattern.removeprefix("(?i)")})' for pat in _FOOTER_PATTERNS)
+    + ')',
+    re.IGNORECASE,
+)
+
+# Junk-line detectors for ``_is_junk_line``
+#   ### [Some other article title](https://sia.az/az/news/...)
+_HEADING_LINK_RE: re.Pattern[str] = re.compile(r'^#{1,6}\s*\[.+\]\(https?://.+\)')
+_MARKDOWN_LINK_RE: re.Pattern[str] = re.compile(r'\[([^\]]+)\]\(https?://[^)]+\)')
+#   Sidebar category + time: "Siyasət 21:07"
+_SIDEBAR_TIME_RE: re.Pattern[str] = re.compile(
+    r'^[A-ZÇĞİÖŞÜА-Я][a-zA-ZçğıöşüÇĞİÖŞÜа-яА-Я\-]+\s+\d{1,2}:\d{2}$',
+)
+
+# Sentence boundaries inside a content line
+_SENTENCE_SPLIT_RE: re.Pattern[str] = re.compile(r'(?<=[.!?])\s+')
+
+
+@functools.lru_cache(maxsize=4096)
+def _word_pattern(keyword: str) -> re.Pattern[str]:
+    """Compiled case-insensitive whole-word pattern for *keyword*."""
+    return re.compile(r'(?i)\b' + re.escape(keyword) + r'\b')
+
+
+@functools.lru_cache(maxsize=1024)
+def _aliases_pattern(aliases: tuple[str, ...]) -> re.Pattern[str]:
+    """One alternation matching any of *aliases* as a whole word."""
+    return re.compile(r'(?i)\b(?:' + '|'.join(map(re.escape, aliases)) + r')\b')
+
 
 def _whole_word_match(keyword: str, text: str) -> bool:
     """
@@ -57,8 +104,7 @@ def _whole_word_match(keyword: str, text: str) -> bool:
     Uses word-boundary regex so "şəki" does NOT match "şəkil",
     but DOES match "Şəki şəhərində" or "about Şəki.".
     """
-    pattern = r'(?i)\b' + re.escape(keyword) + r'\b'
-    return bool(re.search(pattern, text))
+    return _word_pattern(keyword).search(text) is not None
 
 
 def _any_alias_match(aliases: list[str], text: str) -> str | None:
@@ -67,12 +113,175 @@ def _any_alias_match(aliases: list[str], text: str) -> str | None:
 
     Returns the first matching alias, or None if no match.
     """
+    if not aliases:
+        return None
+    # One combined scan settles the common no-match case; only a hit needs
+    # the per-alias passes that decide which alias (in list order) matched.
+    if not _aliases_pattern(tuple(aliases)).search(text):
+        return None
+    if len(aliases) == 1:
+        return aliases[0]
     for alias in aliases:
         if _whole_word_match(alias, text):
             return alias
     return None
 
 
+def _keyword_aliases(user_keyword: Any) -> list[str]:
+    """The keyword followed by its translated aliases (keyword alone if none)."""
+    kw = user_keyword.keyword.strip()
+    aliases = user_keyword.keyword_aliases or []
+    if not aliases:
+        # Fallback: no aliases generated yet, use just the keyword
+        return [kw]
+    if aliases[0] == kw:
+        # Stored normalised (see translation_service.normalize_aliases)
+        return aliases
+    if kw not in aliases:
+        return [kw] + aliases
+    return aliases
+
+
+# ----------------------------------------------------------------------
+# Multi-alias scanning
+# ----------------------------------------------------------------------
+
+class _FoldTable(dict):
+    """
+    ``str.translate`` table folding each character to the form ``re``
+    compares under IGNORECASE, filled in lazily per code point.
+
+    Unlike ``str.lower`` it never changes the text length ("İ" becomes
+    "i", as in ``re``), and it merges the extra case equivalents ``re``
+    honours ("ı"/"i", "ſ"/"s", "ς"/"σ", …) — so folded offsets line up with
+    the original text and a folded substring match is exactly a
+    case-insensitive ``re`` match.
+    """
+
+    # Equivalent pairs whose common uppercase is several characters long
+    _EXTRA: dict[str, str] = {'\u1fd3': '\u0390', '\u1fe3': '\u03b0', '\ufb05': '\ufb06'}
+
+    def __missing__(self, code: int) -> str:
+        lower = chr(code).lower()[0]
+        upper = lower.upper()
+        folded = upper.lower() if len(upper) == 1 and len(upper.lower()) == 1 else lower
+        folded = self._EXTRA.get(folded, folded)
+        self[code] = folded
+        return folded
+
+
+_FOLD_TABLE = _FoldTable()
+
+
+def _is_word_char(char: str) -> bool:
+    """``re``'s notion of a word character (``\\w``) for str patterns."""
+    return char.isalnum() or char == '_'
+
+
+def _is_word_boundary(text: str, index: int) -> bool:
+    """Whether ``\\b`` holds at *index* in *text*."""
+    before = index > 0 and _is_word_char(text[index - 1])
+    after = index < len(text) and _is_word_char(text[index])
+    return before != after
+
+
+class _AliasScanner:
+    """
+    Whole-word, case-insensitive search for many aliases in a single pass.
+
+    Equivalent to running ``_whole_word_match`` for every alias, but the
+    text is walked once by an Aho-Corasick automaton over the folded
+    aliases; word boundaries are then checked on the original text.
+    """
+
+    def __init__(self, aliases: Iterable[str]) -> None:
+        self._automaton = ahocorasick.Automaton()
+        self._folded: dict[str, str] = {}
+        for alias in aliases:
+            if alias in self._folded:
+                continue
+            folded = self._folded[alias] = alias.translate(_FOLD_TABLE)
+            if folded:
+                self._automaton.add_word(folded, folded)
+        self._empty = len(self._automaton) == 0
+        if not self._empty:
+            self._automaton.make_automaton()
+
+    def find(self, text: str) -> set[str]:
+        """Folded aliases occurring in *text* as whole words."""
+        found: set[str] = set()
+        if self._empty or not text:
+            return found
+        for end, alias in self._automaton.iter(text.translate(_FOLD_TABLE)):
+            if alias in found:
+                continue
+            start = end - len(alias) + 1
+            if _is_word_boundary(text, start) and _is_word_boundary(text, end + 1):
+                found.add(alias)
+        return found
+
+    def first_match(self, aliases: list[str], found: set[str], text: str) -> str | None:
+        """First of *aliases* in *found* — same result as ``_any_alias_match``."""
+        for alias in aliases:
+            folded = self._folded.get(alias)
+            if folded is None:
+                folded = alias.translate(_FOLD_TABLE)
+            if not folded:
+                # Nothing to scan for; keep the regex behaviour
+                if _whole_word_match(alias, text):
+                    return alias
+            elif folded in found:
+                return alias
+        return None
+
+
+def _folded_word_match(folded: str, folded_text: str, text: str) -> bool:
+    """
+    Whole-word occurrence of the folded alias in *folded_text*.
+
+    A plain substring search — most texts do not contain the alias at all,
+    and ``str.find`` settles that without entering the regex engine.  Word
+    boundaries are checked on the original *text* (same length), and
+    overlapping occurrences are tried too, as ``\\b`` would.
+    """
+    start = folded_text.find(folded)
+    while start != -1:
+        if _is_word_boundary(text, start) and _is_word_boundary(text, start + len(folded)):
+            return True
+        start = folded_text.find(folded, start + 1)
+    return False
+
+
+class _FoldedAliasMatcher:
+    """
+    ``_AliasScanner`` stand-in for when pyahocorasick is not installed.
+
+    Each text is folded once and every alias is looked up as a substring
+    of the folded copy, so no per-character case folding happens per
+    search; results are the same as ``_any_alias_match``.
+    """
+
+    def __init__(self, aliases: Iterable[str]) -> None:
+        self._folded = {alias: alias.translate(_FOLD_TABLE) for alias in aliases}
+
+    def find(self, text: str) -> str:
+        """Folded copy of *text*, to pass to ``first_match``."""
+        return text.translate(_FOLD_TABLE)
+
+    def first_match(self, aliases: list[str], folded_text: str, text: str) -> str | None:
+        """First of *aliases* occurring in *text* as a whole word."""
+        for alias in aliases:
+            folded = self._folded.get(alias)
+            if folded is None:
+                folded = alias.translate(_FOLD_TABLE)
+            if not folded:
+                if _whole_word_match(alias, text):
+                    return alias
+            elif _folded_word_match(folded, folded_text, text):
+                return alias
+        return None
+
+
 class NewsMatcherService:
     """
     Match articles with user keywords using pure text search + aliases.
@@ -81,11 +290,21 @@ class NewsMatcherService:
     languages (en, az, tr, ru, ar, fr, de).  The matcher checks the article
     against the original keyword AND all its aliases.
 
+    Args:
+        user_keywords: Prefetched ``UserKeyword`` instances to match against.
+            When given, the aliases (and alias scanner) are prepared once
+            and reused for every article; otherwise each call queries the
+            current keywords.
+
     Example:
         >>> matcher = NewsMatcherService()
         >>> matches = matcher.match_article_to_keywords(article)
     """
 
+    def __init__(self, user_keywords: Iterable[Any] | None = None) -> None:
+        self._user_keywords = list(user_keywords) if user_keywords is not None else None
+        self._keyword_index: tuple[list[tuple[Any, str, list[str]]], _AliasScanner | _FoldedAliasMatcher] | None = None
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
@@ -105,8 +324,6 @@ class NewsMatcherService:
             List of dicts with keys: ``user_id``, ``keyword``, ``similarity``,
             ``evidence``, ``keyword_in_text``, ``match_type``.
         """
-        from scraper.models import UserKeyword
-
         title = (article.title or '').strip()
         content = (article.content or '').strip()
         description = (article.description or '').strip()
@@ -116,25 +333,23 @@ class NewsMatcherService:
             logger.debug("Article %d too short (%d chars) — skip", article.id, len(content))
             return []
 
-        user_keywords = UserKeyword.objects.all()
-        if not user_keywords.exists():
+        keyword_aliases, scanner = self._get_keyword_index()
+        if not keyword_aliases:
             return []
 
         matches: list[dict[str, Any]] = []
 
-        for uk in user_keywords:
-            kw = uk.keyword.strip()
-            # Build the full list of text variants to check
-            aliases = uk.keyword_aliases or []
-            if not aliases:
-                # Fallback: no aliases generated yet, use just the keyword
-                aliases = [kw]
-            elif kw not in aliases:
-                aliases = [kw] + aliases
+        # With pyahocorasick, title / description / content are each scanned
+        # once for every alias of every keyword; otherwise each text is
+        # case-folded once and searched per alias.
+        found_title = scanner.find(title)
+        found_desc = scanner.find(description)
+        found_content = None
 
+        for uk, kw, aliases in keyword_aliases:
             # ── METHOD 1: Any alias in TITLE or DESCRIPTION ──
-            title_match = _any_alias_match(aliases, title)
-            desc_match = _any_alias_match(aliases, description)
+            title_match = scanner.first_match(aliases, found_title, title)
+            desc_match = scanner.first_match(aliases, found_desc, description)
 
             if title_match or desc_match:
                 matched_alias = title_match or desc_match
@@ -164,7 +379,9 @@ class NewsMatcherService:
                 continue
 
             # ── METHOD 2: Any alias in CONTENT (real sentences only) ──
-            content_match = _any_alias_match(aliases, content)
+            if found_content is None:
+                found_content = scanner.find(content)
+            content_match = scanner.first_match(aliases, found_content, content)
             if content_match:
                 real_sentence = self._find_real_sentence(content, content_match)
                 if real_sentence:
@@ -193,7 +410,7 @@ class NewsMatcherService:
         matches.sort(key=lambda x: x['similarity'], reverse=True)
         logger.info(
             "Article %d: %d matches found (%d keywords checked)",
-            article.id, len(matches), user_keywords.count(),
+            article.id, len(matches), len(keyword_aliases),
         )
         return matches
 
@@ -201,6 +418,36 @@ class NewsMatcherService:
     # Helpers
     # ------------------------------------------------------------------
 
+    def _get_keyword_index(
+        self,
+    ) -> tuple[list[tuple[Any, str, list[str]]], _AliasScanner | _FoldedAliasMatcher]:
+        """
+        ``(user_keyword, keyword, aliases)`` triples plus the alias scanner.
+
+        Built once for prefetched keywords, per call otherwise.
+        """
+        if self._keyword_index is not None:
+            return self._keyword_index
+
+        if self._user_keywords is not None:
+            user_keywords = self._user_keywords
+        else:
+            from scraper.models import UserKeyword
+
+            user_keywords = UserKeyword.objects.only('id', 'user_id', 'keyword', 'keyword_aliases')
+
+        # Full list of text variants to check, per keyword
+        keyword_aliases = [(uk, uk.keyword.strip(), _keyword_aliases(uk)) for uk in user_keywords]
+        all_aliases = (a for _, _, aliases in keyword_aliases for a in aliases)
+        if ahocorasick is not None:
+            scanner = _AliasScanner(all_aliases)
+        else:
+            scanner = _FoldedAliasMatcher(all_aliases)
+
+        if self._user_keywords is not None:
+            self._keyword_index = (keyword_aliases, scanner)
+        return keyword_aliases, scanner
+
     @staticmethod
     def _is_junk_line(line: str) -> bool:
         """
@@ -208,25 +455,25 @@ class NewsMatcherService:
         rather than actual article body text.
         """
         # Lines starting with common junk markers
-        if line.startswith('[') or line.startswith('!') or line.startswith('*'):
+        if line.startswith(('[', '!', '*')):
             return True
         # Markdown headings that are entirely a link to another article
         # e.g. ### [Azərbaycan və ABŞ ...](https://sia.az/az/news/...)
-        if re.match(r'^#{1,6}\s*\[.+\]\(https?://.+\)', line):
+        if _HEADING_LINK_RE.match(line):
             return True
         # Lines that contain a markdown link taking up most of the line
         # (related article teasers embedded in content)
-        link_match = re.search(r'\[([^\]]+)\]\(https?://[^)]+\)', line)
+        link_match = _MARKDOWN_LINK_RE.search(line)
         if link_match:
             link_text_len = len(link_match.group(0))
             # If the link occupies >70% of the line, it's likely a nav link
             if link_text_len > 0.7 * len(line):
                 return True
         # Sidebar category + time lines like "Siyasət 21:07"
-        if re.match(r'^[A-ZÇĞİÖŞÜА-Я][a-zA-ZçğıöşüÇĞİÖŞÜа-яА-Я\-]+\s+\d{1,2}:\d{2}$', line):
+        if _SIDEBAR_TIME_RE.match(line):
             return True
         # Footer / boilerplate lines (address, copyright, contact info)
-        if any(pat.search(line) for pat in _FOOTER_PATTERNS):
+        if _FOOTER_RE.search(line):
             return True
         return False
 
@@ -245,20 +492,30 @@ class NewsMatcherService:
         - Lines dominated by markdown links (>70% link text)
         - Sidebar category/time labels
         """
-        lines = content.split('\n')
-        for line in lines:
-            line = line.strip()
+        # Only lines that contain a hit are looked at: walk the keyword's
+        # occurrences in the whole text and examine each hit's line once,
+        # in order — the same lines, in the same order, that a line-by-line
+        # scan would accept.
+        pattern = _word_pattern(keyword)
+        line_end = -1
+        for hit in pattern.finditer(content):
+            if hit.start() <= line_end:
+                continue  # line already examined
+            line_start = content.rfind('\n', 0, hit.start()) + 1
+            line_end = content.find('\n', hit.start())
+            if line_end == -1:
+                line_end = len(content)
+            line = content[line_start:line_end].strip()
             if len(line) < min_len:
                 continue
             if NewsMatcherService._is_junk_line(line):
                 continue
-            if _whole_word_match(keyword, line):
-                sentences = re.split(r'(?<=[.!?])\s+', line)
+            if pattern.search(line):
+                sentences = _SENTENCE_SPLIT_RE.split(line)
                 for s in sentences:
-                    if _whole_word_match(keyword, s) and len(s.strip()) >= min_len:
+                    if pattern.search(s) and len(s.strip()) >= min_len:
                         return s.strip()[:200]
-                if len(line) >= min_len:
-                    return line[:200]
+                return line[:200]
         return None
 
     def match_keyword_to_articles(
@@ -279,17 +536,15 @@ class NewsMatcherService:
         from scraper.models import NewsArticle
 
         cutoff = timezone.now() - timedelta(days=recent_days)
-        articles = NewsArticle.objects.filter(scraped_at__gte=cutoff)
-
-        if not articles.exists():
-            return []
+        # Streamed in chunks with only the columns matching needs, instead
+        # of holding every recent article (embeddings included) at once
+        articles = (
+            NewsArticle.objects.filter(scraped_at__gte=cutoff)
+            .only('id', 'title', 'description', 'content', 'url')
+            .iterator(chunk_size=200)
+        )
 
-        kw = user_keyword.keyword.strip()
-        aliases = user_keyword.keyword_aliases or []
-        if not aliases:
-            aliases = [kw]
-        elif kw not in aliases:
-            aliases = [kw] + aliases
+        aliases = _keyword_aliases(user_keyword)
 
         results: list[dict[str, Any]] = []
 
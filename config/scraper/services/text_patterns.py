@@ -0,0 +1,72 @@
+"""
+Regex helpers shared by the scraper and the news matcher.
+
+Both fuse their footer / boilerplate patterns into one alternation.  A
+bare alternation is tried at every position of a line and ends up slower
+than the separate searches, so it is guarded by the characters a match
+can start with.  That set is derived from the patterns themselves here,
+so adding a pattern can never silently make it unreachable.
+"""
+
+from __future__ import annotations
+
+import re
+
+try:
+    from re import _parser as _sre_parse  # Python 3.11+
+except ImportError:  # pragma: no cover - Python 3.10
+    import sre_parse as _sre_parse
+
+
+def _first_chars(items: list, chars: set[str]) -> bool:
+    """
+    Add the characters a match of parsed *items* can start with to *chars*.
+
+    Returns ``False`` when that set cannot be bounded (a leading ``.``,
+    ``\\w``, optional item, …) — the caller then drops the guard.  Items
+    anchored at the line start add nothing: ``^`` is always allowed.
+    """
+    if not items:
+        return False
+    op, arg = items[0]
+    if op is _sre_parse.AT:
+        return arg in (_sre_parse.AT_BEGINNING, _sre_parse.AT_BEGINNING_STRING)
+    if op is _sre_parse.LITERAL:
+        chars.add(re.escape(chr(arg)))
+        return True
+    if op is _sre_parse.IN:
+        for set_op, set_arg in arg:
+            if set_op is _sre_parse.LITERAL:
+                chars.add(re.escape(chr(set_arg)))
+            elif set_op is _sre_parse.RANGE:
+                chars.add(f'{re.escape(chr(set_arg[0]))}-{re.escape(chr(set_arg[1]))}')
+            else:
+                return False
+        return True
+    if op is _sre_parse.SUBPATTERN:
+        return _first_chars(list(arg[-1]), chars)
+    if op is _sre_parse.BRANCH:
+        return all(_first_chars(list(branch), chars) for branch in arg[1])
+    if op in (_sre_parse.MAX_REPEAT, _sre_parse.MIN_REPEAT):
+        min_count, _, item = arg
+        return min_count > 0 and _first_chars(list(item), chars)
+    return False
+
+
+def first_char_guard(patterns: list[re.Pattern[str]]) -> str:
+    """
+    Regex prefix that only lets a fused alternation of *patterns* start at
+    a line start or at a character one of them can begin with.
+
+    Returns ``''`` (no guard) when some pattern can start with an unbounded
+    set of characters, so the fused regex always matches what the separate
+    patterns match.  The character class takes the case flag of the regex
+    it is placed in.
+    """
+    chars: set[str] = set()
+    for pattern in patterns:
+        if not _first_chars(list(_sre_parse.parse(pattern.pattern, pattern.flags)), chars):
+            return ''
+    if not chars:
+        return '^'
+    return f'(?:^|(?=[{"".join(sorted(chars))}]))'
@@ -14,6 +14,7 @@ Example:
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable
 from typing import Any
 
 from django.conf import settings
@@ -33,6 +34,26 @@ _TARGET_LANGUAGES: list[tuple[str, str]] = [
 ]
 
 
+def normalize_aliases(keyword: str, aliases: Iterable[str]) -> list[str]:
+    """
+    Canonical stored form of a keyword's aliases.
+
+    The stripped keyword comes first, followed by the other aliases —
+    stripped, sorted, without empties and without case-insensitive
+    duplicates (matching is case-insensitive, so "Baku" and "baku" would
+    only be scanned twice).  The matcher can then use the list as-is.
+    """
+    kw = keyword.strip()
+    seen = {kw.lower()}
+    result = [kw]
+    for alias in sorted(a.strip() for a in aliases):
+        key = alias.lower()
+        if alias and key not in seen:
+            seen.add(key)
+            result.append(alias)
+    return result
+
+
 class TranslationService:
     """Generate keyword aliases by translating into multiple languages."""
 
@@ -43,9 +64,10 @@ class TranslationService:
         """
         Translate *keyword* into all target languages and return unique aliases.
 
-        Always includes the original keyword.  Duplicates and empty strings
-        are removed.  Translation errors for individual languages are logged
-        and skipped (never fatal).
+        The original keyword always comes first; duplicates (ignoring case)
+        and empty strings are removed — see :func:`normalize_aliases`.
+        Translation errors for individual languages are logged and skipped
+        (never fatal).
 
         Args:
             keyword: The user's original keyword text.
@@ -55,29 +77,24 @@ class TranslationService:
         """
         from deep_translator import GoogleTranslator
 
-        aliases: set[str] = set()
-        # Always include the original keyword (both as-is and lowercased)
-        aliases.add(keyword.strip())
+        translations: list[str] = []
 
         for lang_code, lang_name in self.target_languages:
             try:
                 translated = GoogleTranslator(source='auto', target=lang_code).translate(keyword)
                 if translated and translated.strip():
-                    cleaned = translated.strip()
-                    # Skip if it's identical to the original
-                    if cleaned.lower() != keyword.lower():
-                        aliases.add(cleaned)
-                        logger.debug(
-                            "Translated '%s' -> %s: '%s'",
-                            keyword, lang_name, cleaned,
-                        )
+                    translations.append(translated)
+                    logger.debug(
+                        "Translated '%s' -> %s: '%s'",
+                        keyword, lang_name, translated.strip(),
+                    )
             except Exception:
                 logger.debug(
                     "Translation to %s failed for '%s' — skipping",
                     lang_name, keyword,
                 )
 
-        result = sorted(aliases)
+        result = normalize_aliases(keyword, translations)
         logger.info(
             "Generated %d aliases for keyword '%s': %s",
             len(result), keyword, result,
@@ -23,7 +23,9 @@ import re
 from datetime import timedelta
 from typing import Any
 
+import requests as http_requests
 from celery import shared_task
+from django.db import transaction
 from django.utils import timezone
 
 from .models import (
@@ -35,6 +37,11 @@ from .models import (
 
 logger = logging.getLogger('scraper')
 
+# Junk titles: a media filename or a bare content hash instead of a headline.
+# Compiled once — these run against every scraped article.
+_MEDIA_TITLE_RE = re.compile(r'\.(webp|jpg|jpeg|png|gif|svg|avif|mp4|pdf)$', re.IGNORECASE)
+_HASH_TITLE_RE = re.compile(r'[a-f0-9]{10,}(\.[a-z]{2,5})?', re.IGNORECASE)
+
 
 # =============================================================================
 # AI-POWERED TASKS (autonomous news scraping via Jina AI)
@@ -46,14 +53,20 @@ def scrape_all_active_sources(self) -> str:
     """
     Scheduled task: scrape every active ``NewsSource``.
 
-    Dispatches ``scrape_single_source`` for each active source.  Called
-    automatically by Celery Beat every hour.
+    Dispatches ``scrape_single_source`` for each active source whose
+    ``scrape_interval_hours`` has elapsed.  This is the only scraping entry
+    in the beat schedule; it runs every 5 minutes and the per-source
+    interval decides which sources are actually due.
 
     Returns:
         Summary string.
     """
-    active_sources = NewsSource.objects.filter(is_active=True)
-    count = active_sources.count()
+    # One SELECT of just the scheduling columns, reused for the count.
+    active_sources = list(
+        NewsSource.objects.filter(is_active=True)
+        .only('id', 'name', 'last_scraped', 'scrape_interval_hours')
+    )
+    count = len(active_sources)
 
     if count == 0:
         logger.info("No active news sources to scrape")
@@ -93,7 +106,7 @@ def scrape_single_source(self, source_id: int) -> str:
     1. Fetches the source homepage via Jina AI.
     2. Extracts article links.
     3. Scrapes each article.
-    4. Saves new articles to the database (skips duplicates).
+    4. Bulk-saves new articles to the database (skips duplicates).
     5. Dispatches ``process_new_article`` for each new article.
 
     Args:
@@ -116,31 +129,37 @@ def scrape_single_source(self, source_id: int) -> str:
         scraper = JinaScraperService()
         articles_data = scraper.scrape_multiple_articles(source.url)
 
-        new_count = 0
+        # Stored links were already dropped by the scraper before fetching;
+        # anything that still collides (an older row stored under Jina's
+        # canonical URL, or a concurrent scrape) is left as it is below.
+        seen_urls: set[str] = set()
+
+        new_articles: list[NewsArticle] = []
         for article_data in articles_data:
-            # Duplicate check — skip if URL already exists
             article_url = article_data.get('url', '')
             if not article_url:
                 continue
 
             # Skip junk entries: title is a media filename or hash
             title = article_data.get('title', '')
-            if re.search(r'\.(webp|jpg|jpeg|png|gif|svg|avif|mp4|pdf)$', title, re.IGNORECASE):
+            if _MEDIA_TITLE_RE.search(title):
                 logger.debug("Skipping article with media filename as title: %s", title)
                 continue
-            if re.fullmatch(r'[a-f0-9]{10,}(\.[a-z]{2,5})?', title, re.IGNORECASE):
+            if _HASH_TITLE_RE.fullmatch(title):
                 logger.debug("Skipping article with hash-like title: %s", title)
                 continue
 
-            if NewsArticle.objects.filter(url=article_url).exists():
+            # The same URL may appear twice in one scrape; an upsert batch
+            # must not touch a row more than once.
+            if article_url in seen_urls:
                 logger.debug("Skipping duplicate article: %s", article_url)
                 continue
+            seen_urls.add(article_url)
 
             # Parse publish date
             publish_date = _parse_date(article_data.get('publish_date'))
 
-            # Create the article
-            article = NewsArticle.objects.create(
+            new_articles.append(NewsArticle(
                 source=source,
                 title=article_data.get('title', '')[:500],
                 content=article_data.get('content', ''),
@@ -150,18 +169,35 @@ def scrape_single_source(self, source_id: int) -> str:
                 category=article_data.get('category', '')[:100],
                 publish_date=publish_date,
                 author=article_data.get('author', '')[:200],
+            ))
+
+        # Write all articles in one INSERT ... ON CONFLICT (url) DO UPDATE
+        # per batch.  A URL that is already stored keeps its text and
+        # embedding; only its homepage link is recorded, so the scraper's
+        # known-link filter skips it from now on.  new_count is what that
+        # filter let through, so no extra SELECT is needed.  The source
+        # metadata update shares the transaction, so the insert batches and
+        # the counter bump are committed with a single flush.
+        new_count = len(new_articles)
+        with transaction.atomic():
+            NewsArticle.objects.bulk_create(
+                new_articles,
+                batch_size=500,
+                update_conflicts=True,
+                unique_fields=['url'],
+                update_fields=['article_link'],
             )
-            new_count += 1
-            logger.info("Created article %d: %s", article.id, article.title[:60])
-
-        # Update source metadata
-        source.last_scraped = timezone.now()
-        source.scrape_status = 'success'
-        source.error_message = ''
-        source.total_articles_scraped += new_count
-        source.save(update_fields=[
-            'last_scraped', 'scrape_status', 'error_message', 'total_articles_scraped',
-        ])
+
+            # Update source metadata
+            source.last_scraped = timezone.now()
+            source.scrape_status = 'success'
+            source.error_message = ''
+            source.total_articles_scraped += new_count
+            source.save(update_fields=[
+                'last_scraped', 'scrape_status', 'error_message', 'total_articles_scraped',
+            ])
+        for article in new_articles:
+            logger.info("Created article: %s", article.title[:60])
 
         msg = f"Scraped {source.name}: {new_count} new articles from {len(articles_data)} found"
         logger.info(msg)
@@ -196,9 +232,9 @@ def generate_article_embeddings(batch_size: int = 50) -> str:
     """
     Periodic task: generate embeddings for articles that don't have one yet.
 
-    Picks up ``NewsArticle`` rows where ``content_embedding`` is NULL,
+    Picks up ``NewsArticle`` rows where ``content_embedding_bin`` is NULL,
     generates the embedding via LangChain + sentence-transformers, and
-    indexes them in ElasticSearch.
+    indexes the batch in ElasticSearch with a single bulk stream.
 
     Runs independently of the scraping task so scraping is never blocked.
 
@@ -209,7 +245,8 @@ def generate_article_embeddings(batch_size: int = 50) -> str:
         Summary string.
     """
     articles = list(
-        NewsArticle.objects.filter(content_embedding__isnull=True)
+        NewsArticle.objects.filter(content_embedding_bin__isnull=True)
+        .select_related('source')
         .order_by('scraped_at')[:batch_size]
     )
 
@@ -227,6 +264,7 @@ def generate_article_embeddings(batch_size: int = 50) -> str:
 
     success_count = 0
     es_count = 0
+    es_docs: list[dict[str, Any]] = []
 
     for article in articles:
         try:
@@ -238,61 +276,64 @@ def generate_article_embeddings(batch_size: int = 50) -> str:
             text_for_embedding = processed['processed_content']
 
             # Generate embedding
-            embedding = embedding_svc.get_embedding(text_for_embedding)
+            embedding = embedding_svc.get_embedding_np(text_for_embedding)
 
-            if not embedding or all(v == 0.0 for v in embedding):
+            if not embedding.any():
                 logger.warning("Zero embedding for article %d — skipping", article.id)
                 continue
 
-            article.content_embedding = embedding
-            article.save(update_fields=['content_embedding'])
+            article.set_content_embedding(embedding)
+            article.save(update_fields=['content_embedding', 'content_embedding_bin'])
             success_count += 1
             logger.info("Embedding saved for article %d", article.id)
 
-            # Index in ElasticSearch (graceful — don't fail the whole batch)
-            try:
-                from .services.elasticsearch_service import ElasticSearchService
-
-                es_service = ElasticSearchService()
-                if es_service.is_connected:
-                    indexed = es_service.index_article(
-                        article_id=article.id,
-                        title=article.title,
-                        content=article.content,
-                        embedding=embedding,
-                        metadata={
-                            'description': article.description,
-                            'url': article.url,
-                            'source': article.source.name,
-                            'author': article.author,
-                            'publish_date': (
-                                article.publish_date.isoformat()
-                                if article.publish_date else None
-                            ),
-                            'scraped_at': (
-                                article.scraped_at.isoformat()
-                                if article.scraped_at else None
-                            ),
-                        },
-                    )
-                    if indexed:
-                        article.es_indexed = True
-                        article.es_index_date = timezone.now()
-                        article.save(update_fields=['es_indexed', 'es_index_date'])
-                        es_count += 1
-                else:
-                    logger.warning(
-                        "ElasticSearch unavailable — article %d not indexed",
-                        article.id,
-                    )
-            except Exception:
-                logger.exception(
-                    "ES indexing failed for article %d (non-fatal)", article.id
-                )
+            es_docs.append({
+                'article_id': article.id,
+                'title': article.title,
+                'content': article.content,
+                'description': article.description,
+                'url': article.url,
+                'source': article.source.name,
+                'author': article.author,
+                'publish_date': (
+                    article.publish_date.isoformat()
+                    if article.publish_date else None
+                ),
+                'scraped_at': (
+                    article.scraped_at.isoformat()
+                    if article.scraped_at else None
+                ),
+                'content_embedding': embedding,
+            })
 
         except Exception:
             logger.exception("Embedding failed for article %d", article.id)
 
+    # Index the whole run in ElasticSearch with one bulk stream instead of a
+    # round-trip per article (graceful — embeddings are already saved).
+    if es_docs:
+        try:
+            from .services.elasticsearch_service import ElasticSearchService
+
+            es_service = ElasticSearchService()
+            if es_service.is_connected:
+                indexed_ids = [
+                    article_id
+                    for ok, article_id in es_service.stream_index_articles(es_docs)
+                    if ok
+                ]
+                es_count = NewsArticle.objects.filter(id__in=indexed_ids).update(
+                    es_indexed=True,
+                    es_index_date=timezone.now(),
+                )
+            else:
+                logger.warning(
+                    "ElasticSearch unavailable — %d articles not indexed",
+                    len(es_docs),
+                )
+        except Exception:
+            logger.exception("ES indexing failed for %d articles (non-fatal)", len(es_docs))
+
     msg = (
         f"Embeddings: {success_count}/{len(articles)} generated, "
         f"{es_count} indexed in ES"
@@ -328,32 +369,46 @@ def match_and_notify_users(lookback_hours: int = 24) -> str:
         Summary string.
     """
     cutoff = timezone.now() - timedelta(hours=lookback_hours)
+    # The matcher is text-only: neither embedding copy is loaded
     articles = list(
         NewsArticle.objects.filter(
             scraped_at__gte=cutoff,
-        ).select_related('source')
+        ).defer('content_embedding', 'content_embedding_bin').select_related('source')
     )
 
     if not articles:
         logger.debug("No embedded articles to match in the last %dh", lookback_hours)
         return "No articles to match"
 
+    # Keywords are loaded once for the whole run; the matcher prepares
+    # their aliases a single time instead of querying per article.
+    user_keywords = list(UserKeyword.objects.only('id', 'user_id', 'keyword', 'keyword_aliases'))
+    if not user_keywords:
+        logger.debug("No user keywords — nothing to match")
+        return "No keywords to match"
+
     from .services.news_matcher import NewsMatcherService
 
-    matcher = NewsMatcherService()
+    matcher = NewsMatcherService(user_keywords=user_keywords)
     dispatched = 0
     skipped = 0
 
+    # Every (user, article) pair already delivered for this window, in one
+    # query instead of an EXISTS per match.  Filtering on the same window
+    # through the join keeps the query size independent of the article count.
+    already_sent = set(
+        SentArticle.objects.filter(
+            article__scraped_at__gte=cutoff,
+        ).values_list('user_id', 'article_id')
+    )
+
     for article in articles:
         try:
             matches = matcher.match_article_to_keywords(article)
 
             for match in matches:
                 # Skip if already sent (avoid dispatching unnecessary tasks)
-                if SentArticle.objects.filter(
-                    user_id=match['user_id'],
-                    article_id=article.id,
-                ).exists():
+                if (match['user_id'], article.id) in already_sent:
                     skipped += 1
                     continue
 
@@ -391,7 +446,7 @@ def send_article_to_user(
     """
     Send a matched article to a user via Telegram and record in ``SentArticle``.
 
-    Prevents duplicate sends using the ``unique_together`` constraint.
+    Prevents duplicate sends using the ``uniq_user_article`` constraint.
 
     Args:
         user_id: Telegram user ID.
@@ -404,8 +459,6 @@ def send_article_to_user(
     Returns:
         Summary string.
     """
-    # Replace the API key with a placeholder comment
-        api_url = f"https://api.telegram.org/bot<TELEGRAM_BOT_TOKEN>/sendMessage"
     # Check for duplicate
     if SentArticle.objects.filter(user_id=user_id, article_id=article_id).exists():
         logger.debug("Already sent article %d to user %d — skipping", article_id, user_id)
@@ -474,14 +527,17 @@ def send_article_to_user(
         logger.exception("Failed to send Telegram message to user %d", user_id)
         raise self.retry(exc=Exception("Telegram send failed"))
 
-    # Record delivery
-    SentArticle.objects.get_or_create(
-        user_id=user_id,
-        article=article,
-        defaults={
-            'matched_keyword': matched_keyword,
-            'similarity_score': similarity_score,
-        },
+    # Record delivery — one INSERT that leaves an existing row alone
+    # (unique on user_id + article), instead of get_or_create's SELECT
+    # followed by a savepointed INSERT
+    SentArticle.objects.bulk_create(
+        [SentArticle(
+            user_id=user_id,
+            article=article,
+            matched_keyword=matched_keyword,
+            similarity_score=similarity_score,
+        )],
+        ignore_conflicts=True,
     )
 
     return f"Sent article {article_id} to user {user_id} (keyword='{matched_keyword}', score={similarity_score:.2f})"
@@ -317,7 +317,7 @@ without false positives like 'şəkil' (picture).
             recent_sent = (
                 SentArticle.objects
                 .filter(user_id=user_id, sent_at__gte=cutoff)
-                .select_related('article', 'article__source')
+                .with_article()
                 .order_by('-sent_at')[:10]
             )
 
@@ -14,6 +14,7 @@ Covers:
 
 from __future__ import annotations
 
+import time
 from datetime import timedelta
 from unittest.mock import MagicMock, patch
 
@@ -99,6 +100,46 @@ class NewsArticleModelTest(TestCase):
         article.content_embedding = [0.1] * 100  # Wrong dimension
         self.assertFalse(article.has_embedding)
 
+    def test_set_content_embedding_keeps_binary_copy(self):
+        import numpy as np
+
+        article = NewsArticle.objects.create(
+            source=self.source,
+            title="Vector",
+            content="Content",
+            url="https://test-source.example.com/vec",
+        )
+        article.set_content_embedding([0.5, -0.25, 1.0])
+        article.save()
+        article.refresh_from_db()
+        self.assertEqual(article.content_embedding, [0.5, -0.25, 1.0])
+        self.assertEqual(
+            np.frombuffer(article.content_embedding_bin, dtype=np.float32).tolist(),
+            [0.5, -0.25, 1.0],
+        )
+
+    def test_admin_embedding_flag_checks_dimension(self):
+        from django.contrib.admin.sites import site
+
+        full = NewsArticle.objects.create(
+            source=self.source, title="Full", content="C",
+            url="https://test-source.example.com/full",
+        )
+        full.set_content_embedding([0.1] * 768)
+        full.save()
+        short = NewsArticle.objects.create(
+            source=self.source, title="Short", content="C",
+            url="https://test-source.example.com/short",
+        )
+        short.set_content_embedding([0.1] * 100)  # left over from another model
+        short.save()
+
+        flags = {
+            a.title: a._has_embedding
+            for a in site._registry[NewsArticle].get_queryset(MagicMock())
+        }
+        self.assertEqual(flags, {"Full": True, "Short": False})
+
 
 class UserKeywordModelTest(TestCase):
     """Tests for the UserKeyword model."""
@@ -146,6 +187,13 @@ class SentArticleModelTest(TestCase):
         with self.assertRaises(Exception):
             SentArticle.objects.create(user_id=12345, article=self.article)
 
+    def test_with_article_renders_in_one_query(self):
+        SentArticle.objects.create(user_id=1, article=self.article)
+        SentArticle.objects.create(user_id=2, article=self.article)
+        with self.assertNumQueries(1):
+            rendered = [str(sa) for sa in SentArticle.objects.with_article()]
+        self.assertEqual(len(rendered), 2)
+
 
 # =============================================================================
 # Jina Scraper Tests
@@ -194,6 +242,172 @@ class JinaScraperServiceTest(TestCase):
         self.assertFalse(result['success'])
         self.assertEqual(result['error'], "timeout")
 
+    def test_is_boilerplate_description(self):
+        from .services.jina_scraper import JinaScraperService
+
+        check = JinaScraperService._is_boilerplate_description
+        boilerplate = "Sia.az — Dünya və yerli xəbərlərin tək ünvanı."
+        self.assertTrue(check(boilerplate))
+        self.assertFalse(check("Şəkidə yeni park açıldı"))
+        self.assertFalse(check(""))
+        # Plain substring fallback when pyahocorasick is not installed
+        with patch('scraper.services.jina_scraper._BOILERPLATE_AUTOMATON', None):
+            self.assertTrue(check(boilerplate))
+            self.assertFalse(check("Şəkidə yeni park açıldı"))
+
+    @patch('scraper.services.jina_scraper._MAX_RESPONSE_BYTES', 10)
+    def test_read_body_rejects_oversized_response(self):
+        from .services.jina_scraper import JinaScraperService, ResponseTooLargeError
+
+        response = MagicMock()
+        response.iter_content.return_value = [b'12345', b'67890']
+        self.assertEqual(JinaScraperService._read_body(response), b'1234567890')
+
+        response.iter_content.return_value = [b'12345', b'67890', b'!']
+        with self.assertRaises(ResponseTooLargeError):
+            JinaScraperService._read_body(response)
+
+    @patch('scraper.services.jina_scraper.time.sleep')
+    @patch('scraper.services.jina_scraper.JinaScraperService.scrape_url')
+    @patch('scraper.services.jina_scraper.JinaScraperService._scrape_url_markdown')
+    def test_scrape_multiple_articles_skips_known_urls(self, mock_homepage, mock_scrape, _sleep):
+        """Links already stored as NewsArticle are never fetched again."""
+        from .services.jina_scraper import JinaScraperService
+
+        source = NewsSource.objects.create(name="Known", url="https://known.example.com")
+        NewsArticle.objects.create(
+            source=source,
+            title="Old",
+            content="Old content",
+            url="https://known.example.com/news/100-old",
+        )
+        NewsArticle.objects.create(
+            source=source,
+            title="Canonical",
+            content="Old content",
+            url="https://known.example.com/canonical/300",
+            article_link="https://known.example.com/news/300-linked",
+        )
+        mock_homepage.return_value = {
+            'success': True,
+            'content': (
+                "[Old](/news/100-old)\n"
+                "[New](/news/200-new)\n"
+                "[Linked](/news/300-linked)\n"
+            ),
+        }
+        mock_scrape.side_effect = lambda url: {'success': True, 'url': url}
+
+        articles = JinaScraperService().scrape_multiple_articles("https://known.example.com")
+        mock_scrape.assert_called_once_with("https://known.example.com/news/200-new")
+        self.assertEqual([a['url'] for a in articles], ["https://known.example.com/news/200-new"])
+
+    @patch('scraper.services.jina_scraper.JinaScraperService._scrape_url_json')
+    def test_scrape_url_caches_success(self, mock_fetch):
+        from django.core.cache import cache
+
+        from .services.jina_scraper import JinaScraperService
+
+        cache.clear()
+        scraper = JinaScraperService()
+        mock_fetch.return_value = {'success': False, 'error': 'timeout'}
+        scraper.scrape_url("https://example.com/cached")
+        mock_fetch.return_value = {'title': 'T', 'success': True}
+        self.assertEqual(scraper.scrape_url("https://example.com/cached")['title'], 'T')
+        self.assertEqual(scraper.scrape_url("https://example.com/cached")['title'], 'T')
+        self.assertEqual(mock_fetch.call_count, 2)  # failures are not cached
+
+    def test_rate_limiter_backs_off_and_recovers(self):
+        from .services.jina_scraper import _TokenBucket
+
+        bucket = _TokenBucket(rate=4, capacity=4)
+        throttled = MagicMock(status_code=429, ok=False, headers={'Retry-After': '2'})
+        bucket.feedback(throttled)
+        self.assertEqual(bucket.rate, 2)
+        self.assertGreater(bucket._paused_until, time.monotonic() + 1)
+        ok = MagicMock(status_code=200, ok=True, headers={})
+        for _ in range(30):
+            bucket.feedback(ok)
+        self.assertEqual(bucket.rate, 4)  # capped at the configured ceiling
+
+    def test_extract_publish_date(self):
+        from .services import jina_scraper
+        from .services.jina_scraper import JinaScraperService
+
+        extract = JinaScraperService._extract_publish_date
+        text = "Updated 15.01.2024 — published 14 January 2024"
+        self.assertEqual(extract(text), "14 January 2024")  # format order wins
+        self.assertIsNone(extract("No date here"))
+        # Plain re fallback when hyperscan is not installed
+        with patch.object(jina_scraper, '_DATE_DATABASE', None):
+            self.assertEqual(extract(text), "14 January 2024")
+            self.assertIsNone(extract("No date here"))
+
+    def test_fast_path_domain_allowlist(self):
+        from .services import jina_scraper
+        from .services.jina_scraper import JinaScraperService
+
+        with patch.object(jina_scraper, '_FAST_SCRAPE_DOMAINS', ('azernews.az',)), \
+                patch.object(jina_scraper, 'trafilatura', MagicMock()):
+            self.assertTrue(JinaScraperService._use_fast_path("https://azernews.az/nation/1.html"))
+            self.assertTrue(JinaScraperService._use_fast_path("https://www.azernews.az/a"))
+            self.assertFalse(JinaScraperService._use_fast_path("https://notazernews.az/a"))
+        with patch.object(jina_scraper, 'trafilatura', None):
+            result = JinaScraperService().scrape_url_fast("https://azernews.az/a")
+            self.assertFalse(result['success'])
+
+    def test_fast_path_extracts_meta_charset_page(self):
+        """UTF-8 declared only in <meta> must not be decoded as ISO-8859-1."""
+        import io
+
+        import requests
+        from requests.structures import CaseInsensitiveDict
+        from requests.utils import get_encoding_from_headers
+
+        from .services import jina_scraper
+        from .services.jina_scraper import JinaScraperService
+
+        def html_response(body, content_type):
+            response = requests.Response()
+            response.status_code = 200
+            response.headers = CaseInsensitiveDict({'Content-Type': content_type})
+            response.encoding = get_encoding_from_headers(response.headers)
+            response.raw = io.BytesIO(body)
+            return response
+
+        self.assertIsNone(JinaScraperService._header_charset(html_response(b'', 'text/html')))
+        self.assertEqual(
+            JinaScraperService._header_charset(html_response(b'', 'text/html; charset=UTF-8')),
+            'UTF-8',
+        )
+
+        # Without a header charset the extractors get the raw bytes
+        scraper = JinaScraperService()
+        for content_type, expected in [('text/html', bytes), ('text/html; charset=utf-8', str)]:
+            extractor, parser = MagicMock(), MagicMock()
+            extractor.extract.return_value = "x" * 300
+            parser.return_value.css_first.return_value = None
+            with patch.object(jina_scraper, 'trafilatura', extractor), \
+                    patch.object(jina_scraper, 'HTMLParser', parser), \
+                    patch.object(scraper.session, 'get',
+                                 return_value=html_response(b'<p>\xc9\x99</p>', content_type)):
+                scraper.scrape_url_fast("https://azernews.az/nation/1.html")
+            self.assertIsInstance(extractor.extract.call_args.args[0], expected)
+
+        if jina_scraper.trafilatura is None:
+            self.skipTest("trafilatura / selectolax not installed")
+        paragraph = "Azərbaycan Respublikasının paytaxtı Bakı şəhərində yeni park açıldı. " * 6
+        body = (
+            '<html><head><meta charset="utf-8"><title>Azərbaycan xəbərləri</title></head>'
+            f'<body><article><h1>Azərbaycan xəbərləri</h1><p>{paragraph}</p>'
+            f'<p>{paragraph}</p></article></body></html>'
+        ).encode('utf-8')
+        with patch.object(scraper.session, 'get', return_value=html_response(body, 'text/html')):
+            result = scraper.scrape_url_fast("https://azernews.az/nation/1.html")
+        self.assertTrue(result['success'], result)
+        self.assertIn("Azərbaycan Respublikasının", result['content'])
+        self.assertEqual(result['title'], "Azərbaycan xəbərləri")
+
     @patch('scraper.services.jina_scraper.JinaScraperService.scrape_url')
     def test_scrape_url_mock(self, mock_scrape):
         """Test scraping with a mocked response."""
@@ -268,6 +482,66 @@ class LangChainProcessorTest(TestCase):
 # =============================================================================
 
 
+class EmbeddingMathTest(TestCase):
+    """Tests for the similarity helpers that do not need the model."""
+
+    def test_calculate_similarity(self):
+        from .services.embedding_service import EmbeddingService
+
+        sim = EmbeddingService.calculate_similarity
+        self.assertAlmostEqual(sim([1.0, 2.0, 3.0], [2.0, 4.0, 6.0]), 1.0, places=6)
+        self.assertAlmostEqual(sim([1.0, 0.0], [1.0, 1.0]), 2 ** -0.5, places=6)
+        self.assertEqual(sim([1.0, 0.0], [0.0, 1.0]), 0.0)
+        self.assertEqual(sim([1.0, 0.0], [-1.0, 0.0]), 0.0)  # clamped
+        self.assertEqual(sim([0.0, 0.0], [1.0, 1.0]), 0.0)
+
+    def test_numpy_fallback_without_simsimd(self):
+        with patch('scraper.services.embedding_service.simsimd', None), \
+                patch('scraper.services.embedding_service._cosine_kernel', None):
+            self.test_calculate_similarity()
+            self.test_find_similar_texts_ranking()
+
+    def test_numba_kernel(self):
+        from .services import embedding_service
+
+        if embedding_service._cosine_kernel is None:
+            self.skipTest("numba not installed")
+        with patch('scraper.services.embedding_service.simsimd', None):
+            self.test_calculate_similarity()
+
+    def test_find_similar_texts_ranking(self):
+        from .services.embedding_service import EmbeddingService
+
+        svc = object.__new__(EmbeddingService)  # skip model loading
+        corpus = [[0.0, 1.0], [1.0, 0.1], [0.0, 0.0], [1.0, 0.0], [1.0, 1.0]]
+        results = svc.find_similar_texts([1.0, 0.0], corpus, threshold=0.5, top_k=2)
+        self.assertEqual([r['index'] for r in results], [3, 1])
+        self.assertAlmostEqual(results[0]['score'], 1.0, places=5)
+
+        normed = EmbeddingService.normalize_embeddings(corpus)
+        prenormed = svc.find_similar_texts(
+            [2.0, 0.0], normed, threshold=0.5, top_k=2, normalized=True,
+        )
+        self.assertEqual([r['index'] for r in prenormed], [3, 1])
+        self.assertAlmostEqual(prenormed[1]['score'], results[1]['score'], places=5)
+
+    def test_get_embedding_is_cached(self):
+        from collections import OrderedDict
+
+        import numpy as np
+
+        from .services.embedding_service import EmbeddingService
+
+        svc = object.__new__(EmbeddingService)
+        svc._model = MagicMock()
+        svc._model.encode.side_effect = lambda text, **kw: np.full(768, len(text), np.float32)
+        with patch.object(EmbeddingService, '_cache', OrderedDict()):
+            first = svc.get_embedding("Bakı")
+            first.append(0.0)  # callers get their own copy
+            self.assertEqual(svc.get_embedding("  Bakı "), [4.0] * 768)
+            self.assertEqual(svc._model.encode.call_count, 1)
+
+
 class EmbeddingServiceTest(TestCase):
     """
     Tests for the EmbeddingService.
@@ -425,6 +699,30 @@ class ElasticSearchServiceTest(TestCase):
         self.assertEqual(es.search_by_embedding([0.1] * 768), [])
         self.assertEqual(es.delete_old_articles(), 0)
 
+    @patch('scraper.services.elasticsearch_service.ElasticSearchService')
+    def test_reindex_reads_binary_embeddings(self, mock_es_cls):
+        from django.core.management import call_command
+
+        source = NewsSource.objects.create(name="R", url="https://reindex.example.com")
+        article = NewsArticle.objects.create(
+            source=source, title="T", content="C", url="https://reindex.example.com/1",
+        )
+        article.set_content_embedding([0.25] * 768)
+        article.save()
+
+        sent = []
+        es = mock_es_cls.return_value
+        es.is_connected = True
+        es.stream_index_articles.side_effect = lambda docs, **kw: [
+            (True, doc['article_id']) for doc in docs if not sent.append(doc)
+        ]
+        call_command('reindex_elasticsearch', stdout=MagicMock())
+
+        self.assertEqual(len(sent), 1)
+        self.assertEqual(sent[0]['content_embedding'].tolist(), [0.25] * 768)
+        article.refresh_from_db()
+        self.assertTrue(article.es_indexed)
+
 
 # =============================================================================
 # News Matcher Tests
@@ -501,6 +799,89 @@ class NewsMatcherServiceTest(TestCase):
         matches = matcher.match_article_to_keywords(article)
         self.assertEqual(len(matches), 0)
 
+    def test_prefetched_keywords_skip_queries(self):
+        """A matcher built with prefetched keywords runs no queries per article."""
+        from .services.news_matcher import NewsMatcherService
+
+        article = NewsArticle.objects.create(
+            source=self.source,
+            title="Şəki şəhərində yeni park açıldı",
+            content="Şəki şəhərində yeni park açıldı. " * 5,
+            url="https://matcher-test.example.com/prefetched",
+        )
+        UserKeyword.objects.create(user_id=77777, keyword="Şəki", keyword_aliases=["Sheki"])
+
+        matcher = NewsMatcherService(user_keywords=list(UserKeyword.objects.all()))
+        with self.assertNumQueries(0):
+            matches = matcher.match_article_to_keywords(article)
+            matcher.match_article_to_keywords(article)
+        self.assertEqual([m['user_id'] for m in matches], [77777])
+        self.assertEqual(matches[0]['similarity'], 1.0)
+
+    def test_alias_scanner_agrees_with_regex(self):
+        """The one-pass alias scanners find exactly what the regex finds."""
+        from .services.news_matcher import (
+            _AliasScanner, _FoldedAliasMatcher, _whole_word_match, ahocorasick,
+        )
+
+        aliases = ["Şəki", "İlham", "Baku", "c++", "New York"]
+        scanners = [_FoldedAliasMatcher(aliases)]
+        if ahocorasick is not None:
+            scanners.append(_AliasScanner(aliases))
+        for scanner in scanners:
+            for text in [
+                "ŞƏKİ şəhərində", "Şəkil qalereyası", "ılham Əliyev", "ILHAM",
+                "Baku_news", "(Baku)", "c++ and C++x", "new york times", "NEW-YORK",
+            ]:
+                found = scanner.find(text)
+                for alias in aliases:
+                    self.assertEqual(
+                        scanner.first_match([alias], found, text) == alias,
+                        _whole_word_match(alias, text),
+                        (type(scanner).__name__, alias, text),
+                    )
+
+    def test_fused_footer_regex_reaches_every_pattern(self):
+        """A new footer phrase needs no hand-kept first-character list."""
+        import re
+
+        from .services.text_patterns import first_char_guard
+
+        patterns = [re.compile(r'(?i)^\s*ünvan\s*:'), re.compile(r'(?i)follow\s+us')]
+        fused = re.compile(
+            first_char_guard(patterns) + '(?:'
+            + '|'.join(p.pattern.removeprefix('(?i)') for p in patterns) + ')',
+            re.IGNORECASE,
+        )
+        for line in ["Ünvan: Bakı", "Please follow us on X", "FOLLOW US"]:
+            self.assertTrue(fused.search(line), line)
+        self.assertFalse(fused.search("Bizim ünvan: Bakı"))
+        self.assertEqual(first_char_guard([re.compile(r'\w+ us')]), '')
+
+    def test_match_keyword_to_articles_single_query(self):
+        from .services.news_matcher import NewsMatcherService
+
+        NewsArticle.objects.create(
+            source=self.source,
+            title="Şəki şəhərində yeni park açıldı",
+            content="Şəki şəhərində yeni park açıldı. " * 5,
+            url="https://matcher-test.example.com/by-keyword",
+        )
+        kw = UserKeyword.objects.create(user_id=88888, keyword="Şəki", keyword_aliases=["Sheki"])
+
+        with self.assertNumQueries(1):
+            results = NewsMatcherService().match_keyword_to_articles(kw)
+        self.assertEqual([r['similarity'] for r in results], [1.0])
+
+    def test_normalize_aliases_keyword_first(self):
+        """Stored aliases start with the keyword and carry no duplicates."""
+        from .services.translation_service import normalize_aliases
+
+        self.assertEqual(
+            normalize_aliases(" Şəki ", ["Sheki", "şəki", " ", "Шеки", "sheki"]),
+            ["Şəki", "Sheki", "Шеки"],
+        )
+
 
 # =============================================================================
 # Celery Task Tests (mocked)
@@ -525,6 +906,35 @@ class CeleryTaskTests(TestCase):
         mock_delay.assert_called_once_with(self.source.id)
         self.assertIn("1 sources", result)
 
+    @patch('scraper.tasks.generate_article_embeddings.delay')
+    @patch('scraper.services.jina_scraper.JinaScraperService.scrape_multiple_articles')
+    def test_scrape_single_source_keeps_existing_url(self, mock_scrape, _mock_embed):
+        """A URL that is already stored is not rewritten by the upsert."""
+        from .tasks import scrape_single_source
+
+        existing = NewsArticle.objects.create(
+            source=self.source,
+            title="Old title",
+            content="Old content",
+            url="https://task-test.example.com/news/1",
+            content_embedding=[0.1] * 768,
+            es_indexed=True,
+        )
+        mock_scrape.return_value = [
+            {'url': existing.url, 'article_link': "https://task-test.example.com/n?id=1",
+             'title': "New title", 'content': "New content"},
+            {'url': "https://task-test.example.com/news/2", 'title': "Second", 'content': "Body"},
+        ]
+
+        scrape_single_source(self.source.id)
+
+        existing.refresh_from_db()
+        self.assertEqual(existing.title, "Old title")
+        self.assertEqual(existing.content_embedding, [0.1] * 768)
+        self.assertTrue(existing.es_indexed)
+        self.assertEqual(existing.article_link, "https://task-test.example.com/n?id=1")
+        self.assertEqual(NewsArticle.objects.filter(source=self.source).count(), 2)
+
     def test_scrape_all_no_active_sources(self):
         from .tasks import scrape_all_active_sources
 